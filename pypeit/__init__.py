@@ -32,10 +32,6 @@ msgs = pypmsgs.Messages()
 
 from pypeit import check_requirements  # THIS IMPORT DOES THE CHECKING.  KEEP IT
 
-# Import the close_qa method so that it can be called when a hard stop
-# is requested by the user
-from pypeit.core.qa import close_qa
-
 # Send all signals to messages to be dealt with (i.e. someone hits ctrl+c)
 def signal_handler(signalnum, handler):
     """
@@ -43,7 +39,7 @@ def signal_handler(signalnum, handler):
     """
     if signalnum == 2:
         msgs.info('Ctrl+C was pressed. Ending processes...')
-        close_qa(msgs.pypeit_file)
+        # Closing the messages also generates the QA HTML
         msgs.close()
         sys.exit()
 
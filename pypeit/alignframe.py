@@ -11,7 +11,10 @@ import inspect
 import numpy as np
 from IPython import embed
 
-from pypeit import ginga, msgs, edgetrace
+from astropy.io import fits
+
+from pypeit import ginga, msgs
+from pypeit import io
 from pypeit import masterframe
 from pypeit.par import pypeitpar
 from pypeit.images import pypeitimage
@@ -156,7 +159,8 @@ class Alignment():
     Args:
         msalign (:class:`pypeit.images.pypeitimage.PypeItImage` or None):
             Align image, created by the AlignFrame class
-        tslits_dict (dict or None):  TraceSlits dict
+        slits (:class:`pypeit.slittrace.SlitTraceSet` or None):
+            The slit edges
         spectrograph (:class:`pypeit.spectrographs.spectrograph.Spectrograph` or None):
             The `Spectrograph` instance that sets the
             instrument used to take the observations.  Used to set
@@ -179,8 +183,9 @@ class Alignment():
     # Frametype is a class attribute
     frametype = 'alignment'
     master_type = 'Alignment'
+    master_file_format = 'fits'
 
-    def __init__(self, msalign, tslits_dict, spectrograph, par, det=1,
+    def __init__(self, msalign, slits, spectrograph, par, det=1,
                  binning=None, qa_path=None, msbpm=None):
 
         # MasterFrame
@@ -190,7 +195,7 @@ class Alignment():
 
         # Required parameters (but can be None)
         self.msalign = msalign
-        self.tslits_dict = tslits_dict
+        self.slits = slits
         self.spectrograph = spectrograph
         self.par = par
         self.binning = binning
@@ -206,35 +211,39 @@ class Alignment():
         self.steps = []  # steps executed
 
         # Get the non-linear count level
-        self.nonlinear_counts = 1e10 if self.spectrograph is None \
-            else self.spectrograph.nonlinear_counts(self.det)
+        self.nonlinear_counts = 1e10 if self.spectrograph is None or self.msalign is None \
+            else self.spectrograph.nonlinear_counts(self.msalign.detector)
 
         # --------------------------------------------------------------
         # Set the slitmask and slit boundary related attributes that the
         # code needs for execution. This also deals with alignframes that
         # have a different binning then the images used to defined
         # the slits
-        if self.tslits_dict is not None and self.msalign is not None:
-            self.slitmask_science = pixels.tslits2mask(self.tslits_dict)
+        if self.slits is not None and self.msalign is not None:
+            # Grab the slit edges once; they are used by all the methods
+            self.slit_left_science, self.slit_righ_science, _ = self.slits.select_edges()
+            self.slitmask_science = self.slits.slit_img(use_spatial=False)
             gpm = self.bpm == 0 if self.bpm is not None \
                 else np.ones_like(self.slitmask_science, dtype=bool)
             self.shape_science = self.slitmask_science.shape
             self.shape_align = self.msalign.image.shape
-            self.nslits = self.tslits_dict['slit_left'].shape[1]
+            self.nslits = self.slits.nslits
             self.slit_left = arc.resize_slits2arc(self.shape_align, self.shape_science,
-                                                  self.tslits_dict['slit_left'])
+                                                  self.slit_left_science)
             self.slit_righ = arc.resize_slits2arc(self.shape_align, self.shape_science,
-                                                  self.tslits_dict['slit_righ'])
+                                                  self.slit_righ_science)
             self.slitcen = arc.resize_slits2arc(self.shape_align, self.shape_science,
-                                                self.tslits_dict['slitcen'])
+                                                (self.slit_left_science
+                                                    + self.slit_righ_science)/2)
             self.slitmask = arc.resize_mask2arc(self.shape_align, self.slitmask_science)
             self.gpm = arc.resize_mask2arc(self.shape_align, gpm)
             self.gpm &= self.msalign.image < self.nonlinear_counts
-            self.slit_spat_pos = edgetrace.slit_spat_pos(self.tslits_dict['slit_left'],
-                                                         self.tslits_dict['slit_righ'],
-                                                         self.tslits_dict['nspec'],
-                                                         self.tslits_dict['nspat'])
+            self.slit_spat_pos = self.slits.slit_spat_pos(self.slit_left_science,
+                                                          self.slit_righ_science,
+                                                          self.slits.nspat)
         else:
+            self.slit_left_science = None
+            self.slit_righ_science = None
             self.slitmask_science = None
             self.shape_science = None
             self.shape_align = None
@@ -261,7 +270,7 @@ class Alignment():
             dict:  self.align_dict
         """
         align_prof = dict({})
-        nslits = self.tslits_dict['slit_left'].shape[1]
+        nslits = self.nslits
         # Prepare the plotting canvas
         if show_trace:
             self.show('image', image=self.msalign.image, chname='align_traces', slits=True)
@@ -272,8 +281,8 @@ class Alignment():
             msgs.info("Fitting alignment traces in slit {0:d}".format(sl))
             align_traces, _ = extract.objfind(
                 self.msalign.image, self.slitmask == sl,
-                self.tslits_dict['slit_left'][:, sl],
-                self.tslits_dict['slit_righ'][:, sl],
+                self.slit_left_science[:, sl],
+                self.slit_righ_science[:, sl],
                 ir_redux=False, ncoeff=self.par['trace_npoly'],
                 specobj_dict=specobj_dict, sig_thresh=self.par['sig_thresh'],
                 show_peaks=show_peaks, show_fits=False,
@@ -307,7 +316,7 @@ class Alignment():
             dict:  align_dict
         """
         nbars = len(self.par['locations'])
-        nspec, nslits = self.tslits_dict['slit_left'].shape
+        nspec, nslits = self.slit_left_science.shape
         # Generate an array containing the centroid of all bars
         alignprof = np.zeros((nspec, nbars, nslits))
         for sl in range(nslits):
@@ -315,29 +324,31 @@ class Alignment():
             for bar in range(nbars):
                 if align_prof[sls][bar].SLITID != sl:
                     msgs.error("Alignment profiling failed to generate dictionary")
-                    alignprof[:, bar, sl] = align_prof[sls][bar].TRACE_SPAT
+                alignprof[:, bar, sl] = align_prof[sls][bar].TRACE_SPAT
         # Return the profile information as a single dictionary
         return dict(alignments=alignprof)
 
-    def save(self, outfile=None, overwrite=True):
+    def save(self, outfile, overwrite=True):
         """
         Save the alignment traces to a master frame.
 
         Args:
-            outfile (:obj:`str`, optional):
-                Name of the output file.  Defaults to :attr:`master_file_path`.
+            outfile (:obj:`str`):
+                Name of the output file.
             overwrite (:obj:`bool`, optional):
                 Overwrite any existing file.
         """
-        _outfile = self.master_file_path if outfile is None else outfile
         # Check if it exists
-        if os.path.exists(_outfile) and not overwrite:
-            msgs.warn('Master file exists: {0}'.format(_outfile) + msgs.newline()
+        if os.path.exists(outfile) and not overwrite:
+            msgs.warn('Master file exists: {0}'.format(outfile) + msgs.newline()
                       + 'Set overwrite=True to overwrite it.')
             return
 
         # Report and save
-        prihdr = self.build_master_header(steps=self.steps)
+        prihdr = io.initialize_header()
+        prihdr['MSTRTYP'] = (self.master_type, 'PypeIt: Master frame type')
+        #   - List the completed steps
+        prihdr['STEPS'] = (','.join(self.steps), 'Completed reduction steps')
         #   - Add the binning
         prihdr['BINNING'] = (self.binning, 'PypeIt: Binning')
         #   - Add the detector number
@@ -345,39 +356,31 @@ class Alignment():
         #   - Add the tracing parameters
         self.par.to_header(prihdr)
 
-        # Set the data and extension names
-        data = [self.align_dict['alignments']]
-        extnames = ['ALIGNMENTS']
-        # Write the output to a fits file
-        save.write_fits(prihdr, data, _outfile, extnames=extnames)
-        msgs.info('Master frame written to {0}'.format(_outfile))
+        # Write the alignments to a fits file
+        fits.HDUList([fits.PrimaryHDU(header=prihdr),
+                      fits.ImageHDU(data=self.align_dict['alignments'], name='ALIGNMENTS')]
+                     ).writeto(outfile, overwrite=True, checksum=True)
+        msgs.info('Master frame written to {0}'.format(outfile))
 
-    def load(self, ifile=None):
+    def load(self, ifile):
         """
         Load the profiles of the align frame.
 
         Args:
-            ifile (:obj:`str`, optional):
-                Name of the master frame file.  Defaults to
-                :attr:`master_file_path`.
+            ifile (:obj:`str`):
+                Name of the master frame file.
 
         Returns:
-            dict or None: self.align_dict
+            dict: self.align_dict
         """
-        # Check on whether to reuse and whether the file exists
-        master_file = self.chk_load_master(ifile)
-        if master_file is None:
-            return
-        msgs.info('Loading Master frame: {0}'.format(master_file))
+        msgs.info('Loading Master frame: {0}'.format(ifile))
         # Load
         extnames = ['ALIGNMENTS']
-        *data, head0 = load.load_multiext_fits(master_file, extnames)
+        *data, head0 = load.load_multiext_fits(ifile, extnames)
 
         # Fill the dict
-        self.align_dict = {}
-        keys = []
-        for k in keys:
-            self.align_dict[k] = head0[k.upper()]
+        self.steps = [] if len(head0['STEPS']) == 0 else head0['STEPS'].split(',')
+        self.align_dict = dict(steps=self.steps, par=self.par.data.copy())
         # Data
         for ii, ext in enumerate(extnames):
             self.align_dict[ext.lower()] = data[ii]
@@ -445,13 +448,9 @@ class Alignment():
                 ginga.show_trace(self.viewer, self.channel, spec.TRACE_SPAT, trc_name="", color=color)
 
         if slits:
-            if self.tslits_dict is not None and self.viewer is not None:
-                slit_ids = [edgetrace.get_slitid(image.shape,
-                                                 self.tslits_dict['slit_left'],
-                                                 self.tslits_dict['slit_righ'], ii)[0]
-                            for ii in range(self.tslits_dict['slit_left'].shape[1])]
-                ginga.show_slits(self.viewer, self.channel, self.tslits_dict['slit_left'],
-                                 self.tslits_dict['slit_righ'], slit_ids)
+            if self.slits is not None and self.viewer is not None:
+                ginga.show_slits(self.viewer, self.channel, self.slit_left_science,
+                                 self.slit_righ_science, self.slits.spat_id)
         return
 
     def __repr__(self):
@@ -106,12 +106,14 @@ class BitMask:
     def _prep_flags(self, flag):
         """Prep the flags for use."""
         # Flags must be a numpy array
-        _flag = numpy.array(self.keys()) if flag is None else numpy.atleast_1d(flag).ravel()
+        keys = self.keys()
+        _flag = numpy.array(keys) if flag is None else numpy.atleast_1d(flag).ravel()
         # NULL flags not allowed
         if numpy.any([f == 'NULL' for f in _flag]):
             raise ValueError('Flag name NULL is not allowed.')
         # Flags should be among the bitmask keys
-        indx = numpy.array([f not in self.keys() for f in _flag])
+        keys = set(keys)
+        indx = numpy.array([f not in keys for f in _flag])
         if numpy.any(indx):
             raise ValueError('The following bit names are not recognized: {0}'.format(
                              ', '.join(_flag[indx])))
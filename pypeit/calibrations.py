@@ -6,8 +6,6 @@ Class for guiding calibration object generation in PypeIt
 """
 import os
 
-from abc import ABCMeta
-
 from IPython import embed
 
 import numpy as np
@@ -15,9 +13,7 @@ import numpy as np
 from astropy.io import fits
 
 from pypeit import msgs
-from pypeit import alignframe
 from pypeit import flatfield
-from pypeit import edgetrace
 from pypeit import masterframe
 from pypeit import slittrace
 from pypeit import wavecalib
@@ -35,7 +31,12 @@ class Calibrations(object):
     calibration images and objects in PypeIt.
 
     To avoid rebuilding MasterFrames that were generated during this execution
-    of PypeIt, the class performs book-keeping of these master frames
+    of PypeIt, the class performs book-keeping of these master frames.  If
+    ``reuse_current_masters`` is set in ``par``, a MasterFrame on disk is
+    also loaded instead of being rebuilt, even if ``reuse_masters`` is
+    False, as long as it is newer than the raw files it was built from,
+    including those of the calibration steps it depends on (see
+    :attr:`step_requires`), and none of those steps was rebuilt.
 
     Args:
         fitstbl (:class:`pypeit.metadata.PypeItMetaData`, None):
@@ -88,7 +89,31 @@ class Calibrations(object):
             Used in :func:`get_slits` and propagated beyond
 
     """
-    __metaclass__ = ABCMeta
+    # All instance attributes; children of this class must define
+    # (empty) __slots__ of their own to avoid an instance __dict__.
+    __slots__ = ('fitstbl', 'par', 'spectrograph', 'reuse_masters', 'master_dir',
+                 'slitspat_num', 'qa_path', 'write_qa', 'show', 'det', 'frame', 'binning',
+                 'shape', 'msarc', 'mstilt', 'msalign', 'alignment', 'align_dict', 'msbias',
+                 'msdark', 'msbpm', 'wv_calib', 'slits', 'edges', 'traceImage', 'waveCalib',
+                 'wavecalib', 'wavetilts', 'flatimages', 'calib_ID', 'master_key_dict',
+                 '_step_inputs',
+                 '_calib_group', '_calib_rows', 'steps')
+
+    step_requires = {'bias': [],
+                     'dark': [],
+                     'bpm': ['bias'],
+                     'slits': ['bias', 'dark', 'bpm'],
+                     'arc': ['bias', 'bpm'],
+                     'tiltimg': ['bias', 'bpm', 'slits'],
+                     'wv_calib': ['arc', 'bpm', 'slits'],
+                     'tilts': ['tiltimg', 'bpm', 'slits', 'wv_calib'],
+                     'align': ['bias', 'bpm', 'slits'],
+                     'flats': ['bias', 'dark', 'bpm', 'slits', 'arc', 'wv_calib', 'tilts']}
+    """
+    The calibration steps whose products are used by each step.  Steps
+    not listed are assumed to depend on all other steps.  This sets the
+    MasterFrames checked by :func:`_reuse_master`.
+    """
 
     @classmethod
     def get_instance(cls, fitstbl, par, spectrograph, caldir, qadir=None,
@@ -152,11 +177,15 @@ class Calibrations(object):
         self.mstilt = None
         self.msalign = None
         self.alignment = None
+        self.align_dict = None
         self.msbias = None
         self.msdark = None
         self.msbpm = None
         self.wv_calib = None
         self.slits = None
+        self.edges = None
+        self.traceImage = None
+        self.waveCalib = None
 
         self.wavecalib = None
         self.wavetilts = None
@@ -164,6 +193,14 @@ class Calibrations(object):
         self.calib_ID = None
         self.master_key_dict = {}
 
+        # Raw files used, and whether the MasterFrame was rebuilt, by
+        # each step for the current frame
+        self._step_inputs = {}
+        # Frames in each calib group, and the rows and files in fitstbl
+        # for each (frame type, calib group)
+        self._calib_group = {}
+        self._calib_rows = {}
+
         # Steps
         self.steps = []
 
@@ -183,10 +220,17 @@ class Calibrations(object):
 
         """
         # Grab rows and files
-        rows = self.fitstbl.find_frames(ctype, calib_ID=self.calib_ID, index=True)
-        image_files = self.fitstbl.frame_paths(rows)
+        key = (ctype, self.calib_ID)
+        if key not in self._calib_rows:
+            if self.calib_ID not in self._calib_group:
+                self._calib_group[self.calib_ID] = self.fitstbl.find_calib_group(self.calib_ID)
+            rows = np.where(self.fitstbl.find_frames(ctype)
+                            & self._calib_group[self.calib_ID])[0]
+            self._calib_rows[key] = (rows, self.fitstbl.frame_paths(rows))
+        rows, image_files = self._calib_rows[key]
         # Return
-        return image_files, self.fitstbl.master_key(rows[0] if len(rows) > 0 else self.frame, det=self.det)
+        return list(image_files), \
+                self.fitstbl.master_key(rows[0] if len(rows) > 0 else self.frame, det=self.det)
 
     def set_config(self, frame, det, par=None):
         """
@@ -199,10 +243,6 @@ class Calibrations(object):
             par (:class:`pypeit.par.pypeitpar.CalibrationPar`):
 
         """
-        # Reset internals to None
-        # NOTE: This sets empties calib_ID and master_key_dict so must
-        # be done here first before these things are initialized below.
-
         # Initialize for this setup
         self.frame = frame
         self.calib_ID = int(self.fitstbl['calib'][frame])
@@ -214,7 +254,54 @@ class Calibrations(object):
 
         # Initialize the master key dict for this science/standard frame
         self.master_key_dict['frame'] = self.fitstbl.master_key(frame, det=det)
-        # Initialize the master dict for input, output
+        self._step_inputs = {}
+
+    def _reuse_master(self, masterframe_name, step, raw_files=(), requires=None):
+        """
+        Decide whether a MasterFrame should be loaded from disk
+
+        Existing MasterFrames are always loaded if :attr:`reuse_masters`
+        is True.  Otherwise, they are only loaded if
+        ``reuse_current_masters`` is set in :attr:`par`, the MasterFrame
+        is newer than the raw files used to build it and the MasterFrames
+        it depends on, and none of these MasterFrames was
+        rebuilt for the current frame.  Changes to the parameters are
+        not detected.
+
+        Args:
+            masterframe_name (str): Name of the MasterFrame file
+            step (str): Calibration step that uses the MasterFrame
+            raw_files (list, optional): Raw files used to build the MasterFrame
+            requires (list, optional):
+                Calibration steps whose MasterFrames are used to build
+                the MasterFrame.  If None, set by :attr:`step_requires`.
+
+        Returns:
+            bool: True if the MasterFrame can be loaded
+        """
+        if requires is None:
+            requires = self.step_requires[step] if step in self.step_requires \
+                            else [s for s in self._step_inputs.keys() if s != step]
+        raw_files = set(raw_files)
+        rebuilt = False
+        for s in requires:
+            if s in self._step_inputs:
+                raw_files |= self._step_inputs[s][0]
+                rebuilt |= self._step_inputs[s][1]
+
+        if not os.path.isfile(masterframe_name):
+            reuse = False
+        elif self.reuse_masters:
+            reuse = True
+        elif not self.par['reuse_current_masters'] or rebuilt:
+            reuse = False
+        else:
+            mtime = os.path.getmtime(masterframe_name)
+            reuse = all([os.path.isfile(f) and os.path.getmtime(f) < mtime for f in raw_files])
+            if reuse:
+                msgs.info('Reusing {0}, which is newer than its input'.format(masterframe_name))
+        self._step_inputs[step] = (raw_files, not reuse)
+        return reuse
 
     def get_arc(self):
         """
@@ -238,7 +325,7 @@ class Calibrations(object):
             buildimage.ArcImage, self.master_key_dict['arc'], master_dir=self.master_dir)
 
         # Reuse master frame?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self._reuse_master(masterframe_name, 'arc', arc_files):
             self.msarc = buildimage.ArcImage.from_file(masterframe_name)
         elif len(arc_files) == 0:
             msgs.warn("No frametype=arc files to build arc")
@@ -276,7 +363,7 @@ class Calibrations(object):
             buildimage.TiltImage, self.master_key_dict['tilt'], master_dir=self.master_dir)
 
         # Reuse master frame?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self._reuse_master(masterframe_name, 'tiltimg', tilt_files):
             self.mstilt = buildimage.TiltImage.from_file(masterframe_name)
         elif len(tilt_files) == 0:
             msgs.warn("No frametype=tilt files to build tiltimg")
@@ -292,7 +379,6 @@ class Calibrations(object):
             self.mstilt.to_master_file(masterframe_name)
 
         # TODO in the future add in a tilt_inmask
-        #self._update_cache('tilt', 'tilt_inmask', self.mstilt_inmask)
 
         # Return
         return self.mstilt
@@ -305,87 +391,54 @@ class Calibrations(object):
            master_key, det, par
 
         Returns:
-            ndarray or str: :attr:`align`
+            tuple: The :attr:`msalign` image and the :attr:`align_dict`
+            with the alignment traces.
 
         """
+        # Only needed for IFU data; imported here to keep the import of
+        # this module light
+        from pypeit import alignframe
+
         # Check for existing data
-        if not self._chk_objs(['msbpm', 'tslits_dict']):
+        if not self._chk_objs(['msbpm', 'slits']):
             msgs.error("Don't have all the objects")
 
         # Check internals
         self._chk_set(['det', 'calib_ID', 'par'])
 
         # Prep
-        align_files = self._prep_calibrations('align')
-        #align_rows = self.fitstbl.find_frames('align', calib_ID=self.calib_ID, index=True)
-        #self.align_files = self.fitstbl.frame_paths(align_rows)
-        #self.master_key_dict['align'] \
-        #        = self.fitstbl.master_key(align_rows[0] if len(align_rows) > 0 else self.frame,
-        #                                  det=self.det)
+        align_files, self.master_key_dict['align'] = self._prep_calibrations('align')
         masterframe_name = masterframe.construct_file_name(
             buildimage.AlignImage, self.master_key_dict['align'], master_dir=self.master_dir)
 
-        # Previously cahded?
-        if self._cached('align', self.master_key_dict['align']):
-            # Previously calculated
-            self.msalign = self.calib_dict[self.master_key_dict['align']]['align']
-        elif os.path.isfile(masterframe_name) and self.reuse_masters:
+        # Reuse master frame?
+        if self._reuse_master(masterframe_name, 'align', align_files):
             self.msalign = buildimage.AlignImage.from_file(masterframe_name)
-        else:
-            # Instantiate with everything needed to generate the image (in case we do)
-            #self.alignFrame = alignframe.AlignFrame(self.spectrograph, files=self.align_files,
-            #                                  det=self.det, msbias=self.msbias,
-            #                                  par=self.par['alignframe'],
-            #                                  master_key=self.master_key_dict['align'],
-            #                                  master_dir=self.master_dir,
-            #                                  reuse_masters=self.reuse_masters)
-            self.align = buildimage.buildimage_fromlist(self.spectrograph, self.det,
-                                                         self.par['alignframe'],
-                                                         align_files, bias=self.msbias, bpm=self.msbpm)
-
-            # Load the MasterFrame (if it exists and is desired)?
-            #self.msalign = self.alignFrame.load()
-            #if self.msalign is None:  # Otherwise build it
-            #    msgs.info("Preparing a master {0:s} frame".format(self.alignFrame.master_type))
-            #    self.msalign = self.alignFrame.build_image(bias=self.msbias, bpm=self.msbpm)
-            #    # Need to set head0 here, since a master align frame loaded from file will have head0 set.
-            #    self.msalign.head0 = self.alignFrame.build_master_header(steps=self.alignFrame.process_steps,
-            #                                                         raw_files=self.alignFrame.file_list)
-            #   # Save to Masters
+        elif len(align_files) == 0:
+            msgs.warn("No frametype=align files to build alignment")
+            return
+        else:  # Build it
+            msgs.info("Preparing a master {0:s} frame".format(buildimage.AlignImage.master_type))
+            self.msalign = buildimage.buildimage_fromlist(self.spectrograph, self.det,
+                                                          self.par['alignframe'], align_files,
+                                                          bias=self.msbias, bpm=self.msbpm)
             # Save to Masters
-            self.msalign.to_master_file(self.master_dir, self.master_key_dict['align'],  # Naming
-                                       self.spectrograph.spectrograph,  # Header
-                                       steps=self.msalign.process_steps,
-                                       raw_files=align_files)
-
-            # Store the alignment frame
-            self._update_cache('align', 'align', self.msalign)
-
-        # Check if the alignment dictionary exists
-        if self._cached('align_dict', self.master_key_dict['align']) \
-                and self._cached('wtmask', self.master_key_dict['align']):
-            self.align_dict = self.calib_dict[self.master_key_dict['align']]['align_dict']
-        else:
-            # Extract some header info needed by the algorithm
-            binning = self.spectrograph.get_meta_value(self.align_files[0], 'binning')
+            self.msalign.to_master_file(masterframe_name)
 
-            # Instantiate
-            self.alignment = alignframe.Alignment(self.msalign, self.tslits_dict, self.spectrograph,
-                                                  self.par['alignment'],
-                                                  det=self.det, binning=binning,
-                                                  master_key=self.master_key_dict['align'],
-                                                  master_dir=self.master_dir,
-                                                  reuse_masters=self.reuse_masters,
-                                                  qa_path=self.qa_path, msbpm=self.msbpm)
-
-            # Master
-            self.align_dict = self.alignment.load()
-            if self.align_dict is None:
-                self.align_dict = self.alignment.run(self.show)
-                self.alignment.save()
-
-            # Save & return
-            self._update_cache('align', 'align_dict', self.align_dict)
+        # Instantiate
+        self.alignment = alignframe.Alignment(self.msalign, self.slits, self.spectrograph,
+                                              self.par['alignment'], det=self.det,
+                                              binning=self.msalign.detector.binning,
+                                              qa_path=self.qa_path, msbpm=self.msbpm)
+        # Load the alignment traces from disk (MasterFrame)?
+        alignment_name = masterframe.construct_file_name(
+            alignframe.Alignment, self.master_key_dict['align'], master_dir=self.master_dir)
+        if self._reuse_master(alignment_name, 'alignment', requires=['align', 'slits']):
+            self.align_dict = self.alignment.load(alignment_name)
+        else:
+            # Trace the alignments and save them to Masters
+            self.align_dict = self.alignment.run(show_trace=self.show)
+            self.alignment.save(alignment_name)
 
         return self.msalign, self.align_dict
 
@@ -415,7 +468,7 @@ class Calibrations(object):
             msgs.error("Not ready to load from disk")
 
         # Try to load?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self._reuse_master(masterframe_name, 'bias', bias_files):
             self.msbias = buildimage.BiasImage.from_file(masterframe_name)
         elif len(bias_files) == 0:
             self.msbias = None
@@ -452,7 +505,7 @@ class Calibrations(object):
                                                            master_dir=self.master_dir)
 
         # Try to load?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self._reuse_master(masterframe_name, 'dark', dark_files):
             self.msdark = buildimage.DarkImage.from_file(masterframe_name)
         elif len(dark_files) == 0:
             self.msdark = None
@@ -495,7 +548,7 @@ class Calibrations(object):
 
         # Check if a bias frame exists, and if a BPM should be generated
         msbias = None
-        if self.par['bpm_usebias'] and self._cached('bias', self.master_key_dict['bias']):
+        if self.par['bpm_usebias'] and self.msbias is not None:
             msbias = self.msbias
         # Build it
         self.msbpm = self.spectrograph.bpm(sci_image_file, self.det, msbias=msbias)
@@ -515,6 +568,25 @@ class Calibrations(object):
         Returns:
             :class:`pypeit.flatfield.FlatImages`:
         """
+        # Check internals
+        self._chk_set(['det', 'calib_ID', 'par'])
+
+        # Prep
+        illum_image_files, self.master_key_dict['flat'] = self._prep_calibrations('illumflat')
+        pixflat_image_files, self.master_key_dict['flat'] = self._prep_calibrations('pixelflat')
+
+        masterframe_filename = masterframe.construct_file_name(flatfield.FlatImages,
+                                                           self.master_key_dict['flat'], master_dir=self.master_dir)
+
+        # Nothing to load, build or read?  Then the other calibrations
+        # are not needed.
+        if len(illum_image_files) == 0 and len(pixflat_image_files) == 0 \
+                and self.par['flatfield']['pixelflat_file'] is None \
+                and not os.path.isfile(masterframe_filename):
+            msgs.info('No flat-field frames provided.  Proceeding without flat fielding.')
+            self.flatimages = flatfield.FlatImages(None, None, None, None)
+            return self.flatimages
+
         # Check for existing data
         if not self._chk_objs(['msarc', 'msbpm', 'slits', 'wv_calib']):
             msgs.warn('Must have the arc, bpm, slits, and wv_calib defined to make flats!  Skipping and may crash down the line')
@@ -529,22 +601,14 @@ class Calibrations(object):
             self.flatimages = flatfield.FlatImages(None, None, None, None)
             return
 
-        # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
-
-        # Prep
-        illum_image_files, self.master_key_dict['flat'] = self._prep_calibrations('illumflat')
-        pixflat_image_files, self.master_key_dict['flat'] = self._prep_calibrations('pixelflat')
-
-        masterframe_filename = masterframe.construct_file_name(flatfield.FlatImages,
-                                                           self.master_key_dict['flat'], master_dir=self.master_dir)
         # The following if-elif-else does:
         #   1.  Try to load a MasterFrame (if reuse_masters is True).  If successful, pass it back
         #   2.  Build from scratch
         #   3.  Load any user-supplied images to over-ride any built
 
         # Load MasterFrame?
-        if os.path.isfile(masterframe_filename) and self.reuse_masters:
+        if self._reuse_master(masterframe_filename, 'flats',
+                              illum_image_files + pixflat_image_files):
             self.flatimages = flatfield.FlatImages.from_file(masterframe_filename)
             self.flatimages.is_synced(self.slits)
             self.slits.mask_flats(self.flatimages)
@@ -582,14 +646,7 @@ class Calibrations(object):
         #  NOTE:  This is the *final* images, not just a stack
         #  And it will over-ride what is generated below (if generated)
         if self.par['flatfield']['pixelflat_file'] is not None:
-            # - Name is explicitly correct?
-            # THIS IS DONE IN PYPEITPAR
-            #if os.path.isfile(self.par['flatfield']['pixelflat_file']):
-            #    flat_file = self.par['flatfield']['pixelflat_file']
-            #else:
-            #    msgs.error('Could not find user-defined flatfield file: {0}'.format(
-            #        self.par['flatfield']['pixelflat_file']))
-            # Load
+            # The existence of the file is checked by PypeItPar
             msgs.info('Using user-defined file: {0}'.format('pixelflat_file'))
             with fits.open(self.par['flatfield']['pixelflat_file']) as hdu:
                 self.flatimages.pixelflat = hdu[self.det].data
@@ -624,17 +681,19 @@ class Calibrations(object):
         slit_masterframe_name = masterframe.construct_file_name(slittrace.SlitTraceSet,
                                                            self.master_key_dict['trace'],
                                                            master_dir=self.master_dir)
-        if os.path.isfile(slit_masterframe_name) and self.reuse_masters:
+        if self._reuse_master(slit_masterframe_name, 'slits', trace_image_files):
             self.slits = slittrace.SlitTraceSet.from_file(slit_masterframe_name)
             # Reset the bitmask
             self.slits.mask = self.slits.mask_init.copy()
         else:
-            # Slits don't exist or we're not resusing them
+            # Slits don't exist or we're not resusing them.  The edge
+            # tracing is only imported when it is needed.
+            from pypeit import edgetrace
             edge_masterframe_name = masterframe.construct_file_name(edgetrace.EdgeTraceSet,
                                                                self.master_key_dict['trace'],
                                                                master_dir=self.master_dir)
             # Reuse master frame?
-            if os.path.isfile(edge_masterframe_name) and self.reuse_masters:
+            if self._reuse_master(edge_masterframe_name, 'slits', trace_image_files):
                 self.edges = edgetrace.EdgeTraceSet.from_file(edge_masterframe_name)
             elif len(trace_image_files) == 0:
                 msgs.warn("No frametype=trace files to build slits")
@@ -685,7 +744,7 @@ class Calibrations(object):
 
         # Check internals
         self._chk_set(['det', 'calib_ID', 'par'])
-        if 'arc' not in self.master_key_dict.keys():
+        if 'arc' not in self.master_key_dict:
             msgs.error('Arc master key not set.  First run get_arc.')
 
         # No wavelength calibration requested
@@ -707,7 +766,7 @@ class Calibrations(object):
         # Load from disk (MasterFrame)?
         masterframe_name = masterframe.construct_file_name(wavecalib.WaveCalib, self.master_key_dict['arc'],
                                                            master_dir=self.master_dir)
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self._reuse_master(masterframe_name, 'wv_calib'):
             # Load from disk
             self.wv_calib = self.waveCalib.load(masterframe_name)
             self.slits.mask_wvcalib(self.wv_calib)
@@ -739,13 +798,13 @@ class Calibrations(object):
 
         # Check internals
         self._chk_set(['det', 'calib_ID', 'par'])
-        if 'tilt' not in self.master_key_dict.keys():
+        if 'tilt' not in self.master_key_dict:
             msgs.error('Tilt master key not set.  First run get_tiltimage.')
 
         # Load up?
         masterframe_name = masterframe.construct_file_name(wavetilts.WaveTilts, self.master_key_dict['tilt'],
                                                            master_dir=self.master_dir)
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self._reuse_master(masterframe_name, 'tilts'):
             self.wavetilts = wavetilts.WaveTilts.from_file(masterframe_name)
             self.wavetilts.is_synced(self.slits)
             self.slits.mask_wavetilts(self.wavetilts)
@@ -830,6 +889,8 @@ class MultiSlitCalibrations(Calibrations):
 
     ..todo:: Rename this child or eliminate altogether
     """
+    __slots__ = ()
+
     def __init__(self, fitstbl, par, spectrograph, caldir, **kwargs):
         super(MultiSlitCalibrations, self).__init__(fitstbl, par, spectrograph, caldir, **kwargs)
         self.steps = MultiSlitCalibrations.default_steps()
@@ -854,6 +915,8 @@ class IFUCalibrations(Calibrations):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, fitstbl, par, spectrograph, caldir, **kwargs):
         super(IFUCalibrations, self).__init__(fitstbl, par, spectrograph, caldir, **kwargs)
         self.steps = IFUCalibrations.default_steps()
@@ -868,7 +931,7 @@ class IFUCalibrations(Calibrations):
 
         """
         # Order matters!
-        return ['bias', 'bpm', 'arc', 'tiltimg', 'slits', 'wv_calib', 'tilts', 'align', 'flats', 'wave']
+        return ['bias', 'bpm', 'arc', 'tiltimg', 'slits', 'wv_calib', 'tilts', 'align', 'flats']
 
 
 def check_for_calibs(par, fitstbl, raise_error=True):
@@ -916,7 +979,7 @@ def check_for_calibs(par, fitstbl, raise_error=True):
                     rows = fitstbl.find_frames(ftype, calib_ID=calib_ID, index=True)
                     if len(rows) == 0:
                         # Allow for pixelflat inserted
-                        if ftype is 'pixelflat' and par['calibrations']['flatfield']['pixelflat_file'] is not None:
+                        if ftype == 'pixelflat' and par['calibrations']['flatfield']['pixelflat_file'] is not None:
                             continue
                         # Otherwise fail
                         msg = "No frames of type={} provide for the *{}* processing step. Add them to your PypeIt file!".format(ftype, key)
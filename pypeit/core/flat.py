@@ -482,25 +482,26 @@ def flatfield(sciframe, flatframe, bpix, illum_flat=None, snframe=None, varframe
     if (varframe is not None) & (snframe is not None):
         msgs.error("Cannot set both varframe and snframe")
 
-    # Fold in the slit profile
-    final_flat = flatframe.copy()
+    # Fold in the slit profile.  The flat is only copied if it is
+    # changed; an illumination flat of ones (e.g., off the slits) is
+    # skipped.
+    final_flat = flatframe
     if illum_flat is not None:
         if np.any(illum_flat != 1.0):
             msgs.info('Applying illumination flat')
-            final_flat *= illum_flat  # Previous code was modifying flatframe!
+            final_flat = flatframe * illum_flat  # Previous code was modifying flatframe!
 
     # New image
     retframe = np.zeros_like(sciframe)
-    w = np.where(final_flat > 0.0)
-    retframe[w] = sciframe[w]/final_flat[w]
-    if w[0].size != final_flat.size:
-        ww = np.where(final_flat <= 0.0)
-        bpix[ww] = 1.0
+    gpm = final_flat > 0.0
+    retframe[gpm] = sciframe[gpm]/final_flat[gpm]
+    if not np.all(gpm):
+        bpix[np.invert(gpm)] = 1.0
     # Variance?
     if varframe is not None:
         # This is risky -- Be sure your flat is well behaved!!
         retvar = np.zeros_like(sciframe)
-        retvar[w] = varframe[w]/final_flat[w]**2
+        retvar[gpm] = varframe[gpm]/final_flat[gpm]**2
         return retframe, retvar
     # Error image
     if snframe is None:
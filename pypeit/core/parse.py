@@ -1,19 +1,13 @@
-import collections
 import inspect
 
-import glob
-from os import path
-from multiprocessing import cpu_count
-
 import numpy as np
 
-from astropy.time import Time
-from pypeit import debugger
-
-
 # Logging
 from pypeit import msgs
 
+# Strings accepted for boolean keyword arguments
+_bool_values = {'true': True, 'false': False}
+
 
 def get_current_name():
     """ Return the name of the function that called this function
@@ -136,13 +130,10 @@ def check_deprecated(v, deprecated, upper=False):
     v : str
       A string used by the settings dictionary
     """
-    ll = inspect.currentframe().f_back.f_code.co_name.split('_')
-    func_name = "'" + " ".join(ll) + "'"
-    if upper:
-        v = v.upper()
-    else:
-        v = v.lower()
+    v = v.upper() if upper else v.lower()
     if v in deprecated:
+        ll = inspect.currentframe().f_back.f_code.co_name.split('_')
+        func_name = "'" + " ".join(ll) + "'"
         msgs.error("The argument of {0:s} is deprecated.".format(func_name) + msgs.newline() +
                    "Please choose one of the following:" + msgs.newline() +
                    ", ".join(deprecated))
@@ -168,13 +159,10 @@ def key_allowed(v, allowed, upper=False):
     v : str
       A string used by the settings dictionary
     """
-    ll = inspect.currentframe().f_back.f_code.co_name.split('_')
-    func_name = "'" + " ".join(ll) + "'"
-    if upper:
-        v = v.upper()
-    else:
-        v = v.lower()
+    v = v.upper() if upper else v.lower()
     if v not in allowed:
+        ll = inspect.currentframe().f_back.f_code.co_name.split('_')
+        func_name = "'" + " ".join(ll) + "'"
         msgs.error("The argument of {0:s} must be one of".format(func_name) + msgs.newline() +
                    ", ".join(allowed))
     if v.lower() == "none":
@@ -219,15 +207,12 @@ def key_bool(v):
     v : str
       A string used by the settings dictionary
     """
-    ll = inspect.currentframe().f_back.f_code.co_name.split('_')
-    func_name = "'" + " ".join(ll) + "'"
-    if v.lower() == "true":
-        v = True
-    elif v.lower() == "false":
-        v = False
-    else:
+    b = _bool_values.get(v.lower())
+    if b is None:
+        ll = inspect.currentframe().f_back.f_code.co_name.split('_')
+        func_name = "'" + " ".join(ll) + "'"
         msgs.error("The argument of {0:s} can only be 'True' or 'False'".format(func_name))
-    return v
+    return b
 
 
 def key_check(v):
@@ -360,30 +345,20 @@ def key_list(strlist):
     addarr = []
     # Find the type of the array elements
     for i in temp:
-        if i.lower() == 'none':
+        il = i.lower()
+        if il == 'none':
             # None type
-            addarr += [None]
-        elif i.lower() == 'true' or i.lower() == 'false':
+            addarr.append(None)
+        elif il in _bool_values:
             # bool type
-            addarr += [i.lower() in ['true']]
-        elif ',' in i:
-            # a list
-            addarr += i.lstrip('([').rstrip('])').split(',')
-            msgs.bug("nested lists could cause trouble if elements are not strings!")
-        elif '.' in i:
-            try:
-                # Might be a float
-                addarr += [float(i)]
-            except ValueError:
-                # Must be a string
-                addarr += [i]
+            addarr.append(_bool_values[il])
         else:
             try:
-                # Could be an integer
-                addarr += [int(i)]
+                # Might be a float or an integer
+                addarr.append(float(i) if '.' in i else int(i))
             except ValueError:
                 # Must be a string
-                addarr += [i]
+                addarr.append(i)
     return addarr
 
 
@@ -405,11 +380,11 @@ def key_list_allowed(v, allowed):
     v : list
       A value used by the settings dictionary
     """
-    ll = inspect.currentframe().f_back.f_code.co_name.split('_')
-    func_name = "'" + " ".join(ll) + "'"
     v = key_list(v)
     for ll in v:
         if ll not in allowed:
+            func_name = "'" + " ".join(
+                            inspect.currentframe().f_back.f_code.co_name.split('_')) + "'"
             msgs.error("The allowed list does not include: {0:s}".format(ll) + msgs.newline() +
                        "Please choose one of the following:" + msgs.newline() +
                        ", ".join(allowed) + msgs.newline() +
@@ -433,16 +408,14 @@ def key_none_allowed(v, allowed):
     v : None, str
       A value used by the settings dictionary
     """
-    ll = inspect.currentframe().f_back.f_code.co_name.split('_')
-    func_name = "'" + " ".join(ll) + "'"
-    if v.lower() == "none":
+    vl = v.lower()
+    if vl == "none":
         v = None
-    elif v.lower() in allowed:
-        for i in allowed:
-            if v.lower() == i:
-                v = i
-                break
+    elif vl in allowed:
+        v = vl
     else:
+        ll = inspect.currentframe().f_back.f_code.co_name.split('_')
+        func_name = "'" + " ".join(ll) + "'"
         msgs.error("The argument of {0:s} must be one of".format(func_name) + msgs.newline() +
                    ", ".join(allowed))
     return v
@@ -465,13 +438,11 @@ def key_none_allowed_filename(v, allowed):
     v : None, str
       A value used by the settings dictionary
     """
-    if v.lower() == "none":
+    vl = v.lower()
+    if vl == "none":
         v = None
-    elif v.lower() in allowed:
-        for i in allowed:
-            if v.lower() == i:
-                v = i
-                break
+    elif vl in allowed:
+        v = vl
     else:
         msgs.info("Assuming the following is the name of a file:" + msgs.newline() + v)
     return v
@@ -550,25 +521,29 @@ def key_min_val(v, vmin):
     else:
         return True
 
+# Allowed options used when combining frames; see the combine_*
+# functions below
+_combine_methods = ('mean', 'median', 'weightmean')
+_combine_replaces = ('min', 'max', 'mean', 'median', 'weightmean', 'maxnonsat')
+_combine_satpixs = ('reject', 'force', 'nothing')
+
+
 def combine_methods():
     """ The methods that can be used to combine a set of frames into a master frame
     """
-    methods = ['mean', 'median', 'weightmean']
-    return methods
+    return list(_combine_methods)
 
 
 def combine_replaces():
     """ The options that can be used to replace rejected pixels when combining a set of frames
     """
-    methods = ['min', 'max', 'mean', 'median', 'weightmean', 'maxnonsat']
-    return methods
+    return list(_combine_replaces)
 
 
 def combine_satpixs():
     """ The options that can be used to replace saturated pixels when combining a set of frames
     """
-    methods = ['reject', 'force', 'nothing']
-    return methods
+    return list(_combine_satpixs)
 
 
 def is_keyword(v):
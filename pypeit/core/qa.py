@@ -1,11 +1,12 @@
 """ Module for QA in PypeIt
 """
 import os
-import datetime
-import getpass
-import glob
-import numpy as np
-import yaml
+import re
+import math
+import fnmatch
+import functools
+import shutil
+import tempfile
 
 from IPython import embed
 
@@ -13,6 +14,91 @@ from IPython import embed
 #  THE HTML GENERATION OCCURS FROM msgs
 #from pypeit import msgs
 
+# Repeated HTML fragments
+_HR = '<hr>\n'
+_DIV_END = '</div>\n'
+_UL_END = '</ul>\n'
+_HTML_END = '</body>\n</html>\n'
+_LINKS_START = '<h2>Quick Links</h2>\n<ul>\n'
+_IMG_PRE = '<img class ="research" src="'
+_IMG_POST = '" width="100%" height="auto"/>\n'
+_IMG_ID = '" width="100%" id='
+_IMG_ID_POST = ' height="auto"/>\n'
+
+# Static HTML header; only the title is filled in by html_header
+_HTML_HEADER_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" '
+    '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
+    '\n'
+    '<head>\n'
+    '\n'
+    '<meta http-equiv="Content-Type" content="text/html; charset=UTF-8" />\n'
+    '<title>{title:s}</title>\n'
+    '<meta name="keywords" content="" />\n'
+    '<meta name="description" content="" />\n'
+    '<script type="text/javascript" src="jquery/jquery-1.4.2.min.js"></script>\n'
+    '<script type="text/javascript" src="jquery/jquery.slidertron-0.1.js"></script>\n'
+    '<link href="style.css" rel="stylesheet" type="text/css" media="screen" />\n'
+    '\n'
+    '</head>\n'
+    # Begin the Body
+    '<body>\n'
+    '<h1>{title:s}</h1>\n'
+    '<hr>\n')
+
+# QA filename templates, relative to the output directory, keyed by the
+# QA method.  Entries ending in an underscore are the root for multiple
+# PNGs.
+_QA_FILENAME_TEMPLATES = {
+    'slit_trace_qa': 'PNGs/Slit_Trace_{root:s}.png',
+    'slit_profile_qa': 'QA/PNGs/Slit_Profile_{root:s}_',
+    'arc_fit_qa': 'PNGs/Arc_1dfit_{root:s}_S{slit:04d}.png',
+    'plot_orderfits_Arc': 'QA/PNGs/Arc_lines_{root:s}_S{slit:04d}_',
+    'arc_fit2d_global_qa': 'PNGs/Arc_2dfit_global_{root:s}',
+    'arc_fit2d_orders_qa': 'PNGs/Arc_2dfit_orders_{root:s}',
+    'arc_tilts_spec_qa': 'PNGs/Arc_tilts_spec_{root:s}_S{slit:04d}.png',
+    'arc_tilts_spat_qa': 'PNGs/Arc_tilts_spat_{root:s}_S{slit:04d}.png',
+    'arc_tilts_2d_qa': 'PNGs/Arc_tilts_2d_{root:s}_S{slit:04d}.png',
+    'pca_plot': 'QA/PNGs/{prefix:s}_pca_{root:s}_',
+    'pca_arctilt': 'QA/PNGs/Arc_pca_{root:s}_',
+    'plot_orderfits_Blaze': 'QA/PNGs/Blaze_{root:s}_',
+    'obj_trace_qa': 'QA/PNGs/{root:s}_D{det:02d}_obj_trace.png',
+    'obj_profile_qa': 'QA/PNGs/{root:s}_D{det:02d}_S{slit:04d}_obj_prof.png',
+    'spec_flexure_qa_corr': 'PNGs/{root:s}_D{det:02d}_S{slit:04d}_spec_flex_corr.png',
+    'spec_flexure_qa_sky': 'PNGs/{root:s}_D{det:02d}_S{slit:04d}_spec_flex_sky.png',
+}
+
+# Exposure QA PNGs, e.g. NAME_D01_obj_trace.png or
+# NAME_D01_S0003_spec_flex_corr.png
+_EXP_PNG_RE = re.compile(r'(?P<name>.+)_D(?P<det>\d{2})(?:_S\d{4})?'
+                         r'_(?P<kind>obj_trace|obj_prof|spec_flex_corr|spec_flex_sky)\.png$')
+
+# MasterFrame QA PNGs in the order they appear in the HTML:
+# (QA method, extra pattern, href, label, one PNG per slit)
+_MF_PNG_ENTRIES = (
+    ('slit_trace_qa', '', 'strace', 'Slit Trace', False),
+    ('slit_profile_qa', '*.png', 'sprof', 'Slit Profile', False),
+    ('plot_orderfits_Blaze', '*.png', 'blaze', 'Blaze', False),
+    ('arc_fit_qa', '', 'arc_fit', 'Arc 1D Fit', True),
+    ('pca_arctilt', '*.png', 'arc_pca', 'Arc Tilt PCA', False),
+    ('arc_fit2d_global_qa', '*.png', 'arc_fit2d_global', '2D Arc Global', False),
+    ('arc_fit2d_orders_qa', '*.png', 'arc_fit2d_orders', '2D Arc Orders', False),
+    ('arc_tilts_spec_qa', '', 'arc_tilts_spec', 'Arc Tilts Spec', True),
+    ('arc_tilts_spat_qa', '', 'arc_tilts_spat', 'Arc Tilts Spat', True),
+    ('arc_tilts_2d_qa', '', 'arc_tilts_2d', 'Arc Tilts 2D', True),
+)
+
+# Exposure QA PNGs in the order they appear in the HTML:
+# (kind matched by _EXP_PNG_RE, href, label)
+_EXP_PNG_ENTRIES = (
+    ('obj_trace', 'otrace', 'Object Traces'),
+    ('obj_prof', 'oprofile', 'Object Profiles'),
+    ('spec_flex_corr', 'flex_corr', 'Flexure Cross Correlation'),
+    ('spec_flex_sky', 'flex_sky', 'Flexure Sky'),
+)
+
 # TODO: Move these names to the appropriate class.  This always writes
 # to QA directory, even if the user sets something else...
 def set_qa_filename(root, method, det=None, slit=None, prefix=None, out_dir=None):
@@ -38,53 +124,48 @@ def set_qa_filename(root, method, det=None, slit=None, prefix=None, out_dir=None
     if out_dir is None:
         out_dir = os.getcwd()
     #
-    if method == 'slit_trace_qa':
-#        outfile = 'QA/PNGs/Slit_Trace_{:s}.png'.format(root)
-        outfile = 'PNGs/Slit_Trace_{:s}.png'.format(root)
-    elif method == 'slit_profile_qa':
-        outfile = 'QA/PNGs/Slit_Profile_{:s}_'.format(root)
-    elif method == 'arc_fit_qa':
-#        outfile = 'QA/PNGs/Arc_1dfit_{:s}_S{:04d}.png'.format(root, slit)
-        outfile = 'PNGs/Arc_1dfit_{:s}_S{:04d}.png'.format(root, slit)
-    elif method == 'plot_orderfits_Arc':  # This is root for multiple PNGs
-        outfile = 'QA/PNGs/Arc_lines_{:s}_S{:04d}_'.format(root, slit)
-    elif method == 'arc_fit2d_global_qa':
-#        outfile = 'QA/PNGs/Arc_2dfit_global_{:s}'.format(root)
-        outfile = 'PNGs/Arc_2dfit_global_{:s}'.format(root)
-    elif method == 'arc_fit2d_orders_qa':
-#        outfile = 'QA/PNGs/Arc_2dfit_orders_{:s}'.format(root)
-        outfile = 'PNGs/Arc_2dfit_orders_{:s}'.format(root)
-    elif method == 'arc_tilts_spec_qa':
-#        outfile = 'QA/PNGs/Arc_tilts_spec_{:s}_S{:04d}.png'.format(root, slit)
-        outfile = 'PNGs/Arc_tilts_spec_{:s}_S{:04d}.png'.format(root, slit)
-    elif method == 'arc_tilts_spat_qa':
-#        outfile = 'QA/PNGs/Arc_tilts_spat_{:s}_S{:04d}.png'.format(root, slit)
-        outfile = 'PNGs/Arc_tilts_spat_{:s}_S{:04d}.png'.format(root, slit)
-    elif method == 'arc_tilts_2d_qa':
-#        outfile = 'QA/PNGs/Arc_tilts_2d_{:s}_S{:04d}.png'.format(root, slit)
-        outfile = 'PNGs/Arc_tilts_2d_{:s}_S{:04d}.png'.format(root, slit)
-    elif method == 'pca_plot':  # This is root for multiple PNGs
-        outfile = 'QA/PNGs/{:s}_pca_{:s}_'.format(prefix, root)
-    elif method == 'pca_arctilt':  # This is root for multiple PNGs
-        outfile = 'QA/PNGs/Arc_pca_{:s}_'.format(root)
-    elif method == 'plot_orderfits_Blaze':  # This is root for multiple PNGs
-        outfile = 'QA/PNGs/Blaze_{:s}_'.format(root)
-    elif method == 'obj_trace_qa':
-        outfile = 'QA/PNGs/{:s}_D{:02d}_obj_trace.png'.format(root, det)
-    elif method == 'obj_profile_qa':
-        outfile = 'QA/PNGs/{:s}_D{:02d}_S{:04d}_obj_prof.png'.format(root, det, slit)
-    elif method == 'spec_flexure_qa_corr':
-#        outfile = 'QA/PNGs/{:s}_D{:02d}_S{:04d}_spec_flex_corr.png'.format(root, det, slit)
-        outfile = 'PNGs/{:s}_D{:02d}_S{:04d}_spec_flex_corr.png'.format(root, det, slit)
-    elif method == 'spec_flexure_qa_sky':
-#        outfile = 'QA/PNGs/{:s}_D{:02d}_S{:04d}_spec_flex_sky.png'.format(root, det, slit)
-        outfile = 'PNGs/{:s}_D{:02d}_S{:04d}_spec_flex_sky.png'.format(root, det, slit)
-    else:
+    try:
+        template = _QA_FILENAME_TEMPLATES[method]
+    except KeyError:
         raise IOError("NOT READY FOR THIS QA: {:s}".format(method))
+    outfile = template.format(root=root, det=det, slit=slit, prefix=prefix)
     # Return
     return os.path.join(out_dir, outfile)
 
 
+@functools.lru_cache(maxsize=None)
+def _png_pattern(method, slit):
+    """ Basename template of the PNGs for a QA method
+
+    Args:
+        method (str):
+            QA method; see :func:`set_qa_filename`
+        slit (bool):
+            Match any slit number (S*)
+
+    Returns:
+        str: Template to be formatted with the root name
+    """
+    pattern = os.path.basename(_QA_FILENAME_TEMPLATES[method])
+    # Kludge to handle multiple slits
+    return pattern.replace('S{slit:04d}', 'S*') if slit else pattern
+
+
+def _match_pngs(names, pattern):
+    """ Select the names matching the shell-style pattern
+
+    Args:
+        names (list): File names
+        pattern (str): Shell-style pattern, e.g. Arc_1dfit_A_1_01_S*.png
+
+    Returns:
+        list: Matching names
+    """
+    # Compile once for all the names
+    match = re.compile(fnmatch.translate(pattern)).match
+    return [name for name in names if match(name)]
+
+
 def get_dimen(x, maxp=25):
     """ Assign the plotting dimensions to be the "most square"
 
@@ -109,13 +190,12 @@ def get_dimen(x, maxp=25):
             xt = maxp
         else:
             xt = xr
-        ypg = int(np.sqrt(np.float(xt)))
-        if int(xt) % ypg == 0:
-            xpg = int(xt)/ypg
-        else:
-            xpg = 1 + int(xt)/ypg
-        pages.append([int(xpg), int(ypg)])
-        npp.append(int(xt))
+        xt = int(xt)
+        # Exact for any realistic number of panels
+        ypg = int(math.sqrt(xt))
+        xpg = -(-xt // ypg)
+        pages.append([xpg, ypg])
+        npp.append(xt)
         xr -= xt
     return pages, npp
 
@@ -127,6 +207,9 @@ def gen_timestamp():
     timestamp : str
       user_datetime
     """
+    # Only needed here; imported on first use
+    import datetime
+    import getpass
     tstamp = datetime.datetime.today().strftime('%Y-%b-%d-T%Hh%Mm%Ss')
     user = getpass.getuser()
     # Return
@@ -143,69 +226,64 @@ def html_header(title):
     -------
 
     """
-    head = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    head += '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">\n'
-
-
-    head += '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
-    head += '\n'
-    head += '<head>\n'
-    head += '\n'
-    head += '<meta http-equiv="Content-Type" content="text/html; charset=UTF-8" />\n'
-    head += '<title>{:s}</title>\n'.format(title)
-    head += '<meta name="keywords" content="" />\n'
-    head += '<meta name="description" content="" />\n'
-    head += '<script type="text/javascript" src="jquery/jquery-1.4.2.min.js"></script>\n'
-    head += '<script type="text/javascript" src="jquery/jquery.slidertron-0.1.js"></script>\n'
-    head += '<link href="style.css" rel="stylesheet" type="text/css" media="screen" />\n'
-    head += '\n'
-    head += '</head>\n'
-
-    # Begin the Body
-    head += '<body>\n'
-    head += '<h1>{:s}</h1>\n'.format(title)
-    head += '<hr>\n'
-
-    return head
+    return _HTML_HEADER_TEMPLATE.format(title=title)
 
 def html_end(f, body, links=None):
     """ Fill in the HTML file and end it
     Parameters
     ----------
     f : file
-    body : str
+    body : str or file
+      Body of the page, or a file-like object it has been streamed to
     links : str, optional
     """
     # Write links
     if links is not None:
         f.write(links)
-        f.write('</ul>\n')
-        f.write('<hr>\n')
+        f.write(_UL_END)
+        f.write(_HR)
     # Write body
-    f.write(body)
+    if isinstance(body, str):
+        f.write(body)
+    else:
+        body.seek(0)
+        shutil.copyfileobj(body, f)
     # Finish
-    end = '</body>\n'
-    end += '</html>\n'
+    end = _HTML_END
     f.write(end)
 
     return end
 
 
+def _open_html(filename):
+    """ Open a QA page for writing with a large buffer, so the many
+    small fragment writes are flushed in a few system calls.
+    """
+    return open(filename, 'w', encoding='utf-8', buffering=2**20)
+
+
+def _html_body_buffer():
+    """ Buffer for streaming the body of a QA page before it is written
+    after the quick links.  Kept in memory unless it grows large.
+    """
+    return tempfile.SpooledTemporaryFile(max_size=2**24, mode='w+')
+
+
 def html_init(f, title):
     head = html_header(title)
     f.write(head)
     # Init links
-    links = '<h2>Quick Links</h2>\n'
-    links += '<ul>\n'
-    return links
+    return _LINKS_START
 
 
-def html_mf_pngs(idval):
+def html_mf_pngs(idval, all_pngs=None):
     """ Generate HTML for MasterFrame PNGs
 
     Args:
         idval: str
           Master key of the calibration set
+        all_pngs: list, optional
+          Files in QA/PNGs.  If None, the folder is listed here.
 
     Returns:
         links: str
@@ -214,79 +292,61 @@ def html_mf_pngs(idval):
           HTML edits for the main body
 
     """
-    links = ''
-    body = ''
+    links = []
+    body = []
     # QA root
     # Search for PNGs
+    if all_pngs is None:
+        all_pngs = os.listdir('QA/PNGs') if os.path.isdir('QA/PNGs') else []
+    # Nothing to do if none of the PNGs are for this calibration set
+    if not any(idval in png for png in all_pngs):
+        return '', ''
 
-    # Organize the outputs
-    html_dict = {}
-    html_dict['strace'] = dict(fname='slit_trace_qa', ext='',
-                               href='strace', label='Slit Trace', slit=False)
-    html_dict['sprof'] = dict(fname='slit_profile_qa', ext='*.png',
-                              href='sprof', label='Slit Profile', slit=False)
-    html_dict['blaze'] = dict(fname='plot_orderfits_Blaze', ext='*.png',
-                              href='blaze', label='Blaze', slit=False)
-    html_dict['arc_fit'] = dict(fname='arc_fit_qa', ext='',
-                                href='arc_fit', label='Arc 1D Fit', slit=True)
-    html_dict['arc_tilts_spec'] = dict(fname='arc_tilts_spec_qa', ext='',
-                                       href='arc_tilts_spec', label='Arc Tilts Spec', slit=True)
-    html_dict['arc_tilts_spat'] = dict(fname='arc_tilts_spat_qa', ext='',
-                                 href='arc_tilts_spat', label='Arc Tilts Spat', slit=True)
-    html_dict['arc_tilts_2d'] = dict(fname='arc_tilts_2d_qa', ext='',
-                                       href='arc_tilts_2d', label='Arc Tilts 2D', slit=True)
-    html_dict['arc_pca'] = dict(fname='pca_arctilt', ext='*.png',
-                                href='arc_pca', label='Arc Tilt PCA', slit=False)
-    html_dict['arc_fit2d_global'] = dict(fname='arc_fit2d_global_qa', ext='*.png',
-                                         href='arc_fit2d_global', label='2D Arc Global', slit=False)
-    html_dict['arc_fit2d_orders'] = dict(fname='arc_fit2d_orders_qa', ext='*.png',
-                                         href='arc_fit2d_orders', label='2D Arc Orders', slit=False)
+    slit_root = '{:s}_S'.format(idval)
 
     # Generate HTML
-    for key in ['strace', 'sprof', 'blaze', 'arc_fit', 'arc_pca', 'arc_fit2d_global', 'arc_fit2d_orders',
-                'arc_tilts_spec', 'arc_tilts_spat', 'arc_tilts_2d']:
-        # PNG Root
-        png_root = set_qa_filename(idval, html_dict[key]['fname'], slit=9999, out_dir='QA')
-        if html_dict[key]['slit']:  # Kludge to handle multiple slits
-            png_root = png_root.replace('S9999', 'S*')
+    for fname, ext, href_root, label, slit in _MF_PNG_ENTRIES:
         # Find the PNGs
-        pngs = glob.glob(png_root+html_dict[key]['ext'])
+        pattern = _png_pattern(fname, slit).format(root=idval, slit=9999) + ext
+        pngs = ['QA/PNGs/'+png for png in _match_pngs(all_pngs, pattern)]
         pngs.sort()
         if len(pngs) > 0:
-            href="{:s}_{:s}".format(html_dict[key]['href'], idval)
+            href="{:s}_{:s}".format(href_root, idval)
             # Link
-            links += '<li><a class="reference internal" href="#{:s}">{:s} {:s}</a></li>\n'.format(
-                href, html_dict[key]['label'], idval)
+            links.append('<li><a class="reference internal" href="#{:s}">{:s} {:s}</a></li>\n'.format(
+                href, label, idval))
             # Body
-            body += '<hr>\n'
-            body += '<div class="section" id="{:s}">\n'.format(href)
-            body += '<h2> {:s} {:s} </h2>\n'.format(html_dict[key]['label'], idval)
+            body.append(_HR)
+            body.append('<div class="section" id="{:s}">\n'.format(href))
+            body.append('<h2> {:s} {:s} </h2>\n'.format(label, idval))
             for png in pngs:
                 # Remove QA
-                ifnd = png.find('QA/')
-                if ifnd < 0:
+                if not png.startswith('QA/'):
                     raise ValueError("QA is expected to be in the path!")
-                if html_dict[key]['slit']:  # Kludge to handle multiple slits
-                    i0 = png.find('{:s}_S'.format(idval))
-                    href="{:s}_{:s}".format(html_dict[key]['href'], png[i0:])
-                    body += '<img class ="research" src="{:s}" width="100%" id={:s} height="auto"/>\n'.format(
-                        png[ifnd+3:], href)
-                    links += '<li><a class="reference internal" href="#{:s}">{:s} {:s}</a></li>\n'.format(
-                        href, html_dict[key]['label'], png[i0:-4])
+                png_src = png[3:]
+                if slit:  # Kludge to handle multiple slits
+                    i0 = png.find(slit_root)
+                    href = href_root + '_' + png[i0:]
+                    body.append(''.join((_IMG_PRE, png_src, _IMG_ID, href, _IMG_ID_POST)))
+                    links.append('<li><a class="reference internal" href="#' + href + '">'
+                                 + label + ' ' + png[i0:-4] + '</a></li>\n')
                 else:
-                    body += '<img class ="research" src="{:s}" width="100%" height="auto"/>\n'.format(png[ifnd+3:])
-            body += '</div>\n'
+                    body.append(''.join((_IMG_PRE, png_src, _IMG_POST)))
+            body.append(_DIV_END)
 
     # Return
-    return links, body
+    return ''.join(links), ''.join(body)
 
 
-def html_exp_pngs(exp_name, det):
+def html_exp_pngs(exp_name, det, index):
     """ 
     Parameters
     ----------
     exp_name : str
     det : int
+    index : dict
+      PNG files in QA/PNGs keyed by (exp_name, det, kind);
+      see :func:`index_exp_pngs`
 
     Returns
     -------
@@ -294,45 +354,52 @@ def html_exp_pngs(exp_name, det):
     body : str
 
     """
-    links = ''
-    body = ''
+    links = []
+    body = []
     # QA root
 
-    # Organize the outputs
-    html_dict = {}
-    html_dict['trace'] = dict(fname='obj_trace_qa', ext='', slit=False,
-                               href='otrace', label='Object Traces')
-    html_dict['prof'] = dict(fname='obj_profile_qa', ext='', slit=True,
-                              href='oprofile', label='Object Profiles')
-    html_dict['flex_corr'] = dict(fname='flexure_qa_corr', ext='', slit=True,
-                             href='flex_corr', label='Flexure Cross Correlation')
-    html_dict['flex_sky'] = dict(fname='flexure_qa_sky', ext='', slit=True,
-                                  href='flex_sky', label='Flexure Sky')
+    # Nothing to do if there are no PNGs for this exposure and detector
+    if not any((exp_name, det, kind) in index for kind, _, _ in _EXP_PNG_ENTRIES):
+        return '', ''
 
     # Generate HTML
-    for key in ['trace', 'prof', 'flex_corr', 'flex_sky']:
-        png_root = set_qa_filename(exp_name, html_dict[key]['fname'], det=det, slit=9999)
-        if html_dict[key]['slit']:  # Kludge to handle multiple slits
-            png_root = png_root.replace('S9999', 'S*')
-        pngs = glob.glob(png_root+html_dict[key]['ext'])
+    for kind, href_root, label in _EXP_PNG_ENTRIES:
+        pngs = index.get((exp_name, det, kind), [])
         if len(pngs) > 0:
-            href="{:s}_{:02d}".format(html_dict[key]['href'], det)
+            href="{:s}_{:02d}".format(href_root, det)
             # Link
-            links += '<li><a class="reference internal" href="#{:s}">{:s} {:02d}</a></li>\n'.format(href, html_dict[key]['label'], det)
+            links.append('<li><a class="reference internal" href="#{:s}">{:s} {:02d}</a></li>\n'.format(href, label, det))
             # Body
-            body += '<hr>\n'
-            body += '<div class="section" id="{:s}">\n'.format(href)
-            body += '<h2> {:s} {:02d} </h2>\n'.format(html_dict[key]['label'], det)
+            body.append(_HR)
+            body.append('<div class="section" id="{:s}">\n'.format(href))
+            body.append('<h2> {:s} {:02d} </h2>\n'.format(label, det))
             for png in pngs:
                 # Remove QA
-                ifnd = png.find('QA/')
-                if ifnd < 0:
+                if not png.startswith('QA/'):
                     raise ValueError("QA is expected to be in the path!")
-                body += '<img class ="research" src="{:s}" width="100%" height="auto"/>\n'.format(png[ifnd+3:])
-            body += '</div>\n'
+                png_src = png[3:]
+                body.append(''.join((_IMG_PRE, png_src, _IMG_POST)))
+            body.append(_DIV_END)
 
     # Return
-    return links, body
+    return ''.join(links), ''.join(body)
+
+@functools.lru_cache(maxsize=8)
+def _read_calib_file(calib_file, mtime):
+    """ Parse a .calib file
+
+    The modification time is only used as part of the cache key, so
+    that an edited file is read again.  The returned dict is shared
+    between calls and must not be modified.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    with open(calib_file, 'r') as infile:
+        return yaml.load(infile, Loader=Loader)
+
 
 def gen_mf_html(pypeit_file, qa_path):
     """ Generate the HTML for a MasterFrame set
@@ -345,8 +412,7 @@ def gen_mf_html(pypeit_file, qa_path):
     """
     # Read calib file
     calib_file = pypeit_file.replace('.pypeit', '.calib')
-    with open(calib_file, 'r') as infile:
-        calib_dict = yaml.load(infile, Loader=yaml.FullLoader)
+    calib_dict = _read_calib_file(calib_file, os.path.getmtime(calib_file))
     # Parse
     setup = list(calib_dict.keys())[0]
     cbsets = []
@@ -358,66 +424,120 @@ def gen_mf_html(pypeit_file, qa_path):
         else:
             cbsets.append(key)
     # TODO -- Read in spectograph from .pypeit file and then use spectrograph.ndet
-    dets = (1+np.arange(99)).tolist()
+    dets = list(range(1, 100))
     # Generate MF file
     MF_filename = os.path.join('{:s}'.format(qa_path), 'MF_{:s}.html'.format(setup))
-    body = ''
-    with open(MF_filename,'w') as f:
+    # List the PNGs once for all the calib sets and detectors
+    all_pngs = os.listdir('QA/PNGs') if os.path.isdir('QA/PNGs') else []
+    with _open_html(MF_filename) as f, _html_body_buffer() as body:
         # Start
-        links = html_init(f, 'QA  Setup {:s}: MasterFrame files'.format(setup))
+        links = [html_init(f, 'QA  Setup {:s}: MasterFrame files'.format(setup))]
         # Loop on calib_sets
         for cbset in cbsets:
             for det in dets:
                 # Run
                 idval = '{:s}_{:d}_{:02d}'.format(setup, cbset, det)
-                new_links, new_body = html_mf_pngs(idval)
+                new_links, new_body = html_mf_pngs(idval, all_pngs=all_pngs)
                 # Save
-                links += new_links
-                body += new_body
+                links.append(new_links)
+                body.write(new_body)
         # End
-        html_end(f, body, links)
+        html_end(f, body, ''.join(links))
     #
     print("Wrote: {:s}".format(MF_filename))
 
+def index_exp_pngs(png_path='QA/PNGs'):
+    """ Bucket the exposure QA PNGs with a single pass through the PNG folder
+
+    Args:
+        png_path (str, optional):
+            Path to the PNG folder
+
+    Returns:
+        dict: Lists of PNG files, including png_path, keyed by
+        (exposure name, detector, kind), where kind is one of obj_trace,
+        obj_prof, spec_flex_corr or spec_flex_sky
+    """
+    index = {}
+    if not os.path.isdir(png_path):
+        return index
+    for entry in os.scandir(png_path):
+        match = _EXP_PNG_RE.match(entry.name)
+        if match is None or not entry.is_file():
+            continue
+        key = (match.group('name'), int(match.group('det')), match.group('kind'))
+        index.setdefault(key, []).append(os.path.join(png_path, entry.name))
+    for pngs in index.values():
+        pngs.sort()
+    return index
+
+
+def _write_exp_html(uni_name, dets, index):
+    """ Write the QA HTML page for a single exposure
+
+    Args:
+        uni_name (str):
+            Exposure name
+        dets (list):
+            Detectors with QA PNGs for this exposure
+        index (dict):
+            See :func:`index_exp_pngs`
+    """
+    # Generate MF file
+    exp_filename = 'QA/{:s}.html'.format(uni_name)
+    with _open_html(exp_filename) as f, _html_body_buffer() as body:
+        # Start
+        links = [html_init(f, 'QA for {:s}'.format(uni_name))]
+        # Loop on the detectors with QA
+        for det in dets:
+            # Run
+            new_links, new_body = html_exp_pngs(uni_name, det, index)
+            # Save
+            links.append(new_links)
+            body.write(new_body)
+        # End
+        html_end(f, body, ''.join(links))
+    print("Wrote: {:s}".format(exp_filename))
+
+
 def gen_exp_html():
+    # Index all the exposure PNGs
+    index = index_exp_pngs()
     # Find all obj_trace files -- Not fool proof but ok
-    obj_files = glob.glob('QA/PNGs/*obj_trace.png')
-    # Parse for names
-    names = []
-    for obj_file in obj_files:
-        i0 = obj_file.rfind('/')+1
-        i1 = obj_file.rfind('_D')
-        name = obj_file[i0:i1]
-        names.append(name)
-    uni_names = np.unique(names)
+    uni_names = sorted(set(name for name, _, kind in index.keys() if kind == 'obj_trace'))
+    # Detectors with any QA for each exposure
+    dets_by_name = {}
+    for name, det, _ in index.keys():
+        dets_by_name.setdefault(name, set()).add(det)
     # Loop
     for uni_name in uni_names:
-        # Generate MF file
-        exp_filename = 'QA/{:s}.html'.format(uni_name)
-        body = ''
-        with open(exp_filename,'w') as f:
-            # Start
-            links = html_init(f, 'QA for {:s}'.format(uni_name))
-            # Loop on detector
-            for det in range(1,99):
-                # Run
-                new_links, new_body = html_exp_pngs(uni_name, det)
-                # Save
-                links += new_links
-                body += new_body
-            # End
-            html_end(f, body, links)
-        print("Wrote: {:s}".format(exp_filename))
+        _write_exp_html(uni_name, sorted(dets_by_name[uni_name]), index)
 
 
-def close_qa(pypeit_file):
-    if pypeit_file is None:
+def close_qa(pypeit_file, qa_path):
+    """ Generate whatever QA HTML is possible when PypeIt exits early
+
+    This is a best-effort hook: any error is logged as a warning and
+    ignored, such that it cannot hide the error that stopped PypeIt.
+
+    Args:
+        pypeit_file (str):
+            Name of the PypeIt file.  Nothing is done if None.
+        qa_path (str):
+            Path to the QA folder of the run.  Nothing is done if None.
+    """
+    if pypeit_file is None or qa_path is None:
         return
+    # Imported here because pypeit.pypmsgs imports this module
+    from pypeit import msgs
+    try:
+        gen_mf_html(pypeit_file, qa_path)
+    except Exception as e:
+        # Likely crashed real early; the exposure QA may still exist
+        msgs.warn("Could not generate the MasterFrame QA HTML: {0}".format(e))
     try:
-        gen_mf_html(pypeit_file)
-    except:  # Likely crashed real early
-        pass
-    else:
         gen_exp_html()
+    except Exception as e:
+        msgs.warn("Could not generate the exposure QA HTML: {0}".format(e))
 
 
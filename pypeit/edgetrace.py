@@ -1096,8 +1096,8 @@ class EdgeTraceSet(object):
 
         # Determine if the file should be compressed
         compress = False
-        if outfile.split('.')[-1] == 'gz':
-            outfile = outfile[:outfile.rfind('.')]
+        if outfile.endswith('.gz'):
+            outfile = outfile[:-3]
             compress = True
 
         # First check if a trace is available
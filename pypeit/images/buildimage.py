@@ -160,6 +160,8 @@ def buildimage_fromlist(spectrograph, det, frame_par, file_list,
         finalImage = DarkImage.from_pypeitimage(pypeitImage)
     elif frame_par['frametype'] == 'arc':
         finalImage = ArcImage.from_pypeitimage(pypeitImage)
+    elif frame_par['frametype'] == 'align':
+        finalImage = AlignImage.from_pypeitimage(pypeitImage)
     elif frame_par['frametype'] == 'tilt':
         finalImage = TiltImage.from_pypeitimage(pypeitImage)
     elif frame_par['frametype'] == 'trace':
@@ -96,24 +96,26 @@ class CombineImage(object):
             if nimages == 1:
                 return pypeitImage
             elif kk == 0:
-                # Get ready
+                # Get ready.  The image, variance and mask stacks are
+                # filled for every image, so they need not be initialized.
                 shape = (nimages, pypeitImage.image.shape[0], pypeitImage.image.shape[1])
-                img_stack = np.zeros(shape)
-                ivar_stack= np.zeros(shape)
+                img_stack = np.empty(shape)
+                var_stack = np.empty(shape)
                 rn2img_stack = np.zeros(shape)
                 crmask_stack = np.zeros(shape, dtype=bool)
                 # Mask
                 bitmask = imagebitmask.ImageBitMask()
-                mask_stack = np.zeros(shape, bitmask.minimum_dtype(asuint=True))
+                mask_stack = np.empty(shape, bitmask.minimum_dtype(asuint=True))
             # Grab the lamp status
             lampstat += [self.spectrograph.get_lamps_status(pypeitImage.rawheadlist)]
             # Process
             img_stack[kk,:,:] = pypeitImage.image
-            # Construct raw variance image and turn into inverse variance
+            # Construct raw variance image; stored directly instead of
+            # inverting a stack of inverse variances
             if pypeitImage.ivar is not None:
-                ivar_stack[kk, :, :] = pypeitImage.ivar
+                var_stack[kk, :, :] = utils.inverse(pypeitImage.ivar)
             else:
-                ivar_stack[kk, :, :] = 1.
+                var_stack[kk, :, :] = 1.
             # Mask cosmic rays
             if pypeitImage.crmask is not None:
                 crmask_stack[kk, :, :] = pypeitImage.crmask
@@ -147,7 +149,6 @@ class CombineImage(object):
         # Coadd them
         weights = np.ones(nimages)/float(nimages)
         img_list = [img_stack]
-        var_stack = utils.inverse(ivar_stack)
         var_list = [var_stack, rn2img_stack]
         img_list_out, var_list_out, outmask, nused = combine.weighted_combine(
             weights, img_list, var_list, (mask_stack == 0),
@@ -172,7 +172,7 @@ def compress_file(ifile, overwrite=False, rm_original=True):
             the file exists and `overwrite` is False.
     """
     # Nominally check if the file is already compressed
-    if ifile.split('.')[-1] == 'gz':
+    if ifile.endswith('.gz'):
         raise ValueError('File appears to already have been compressed! {0}'.format(ifile))
 
     # Construct the output file name and check if it exists
@@ -567,7 +567,7 @@ def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True)
         raise FileExistsError('File already exists; to overwrite, set overwrite=True.')
 
     # Determine if the file should be compressed
-    _ofile = ofile[:ofile.rfind('.')] if ofile.split('.')[-1] == 'gz' else ofile
+    _ofile = ofile[:-3] if ofile.endswith('.gz') else ofile
 
     _hdr = initialize_header() if hdr is None else hdr.copy()
 
@@ -43,9 +43,6 @@ Define a utility base class used to hold parameters.
 import os
 import warnings
 import textwrap
-import sys
-if sys.version > '3':
-    long = int
 
 import numpy
 
@@ -498,7 +495,7 @@ class ParSet(object):
                         if include_descr:
                             try:
                                 section_comment = par.descr[k] + ': ' + indx
-                            except:
+                            except (AttributeError, KeyError, TypeError):
                                 pass
                         lines += ParSet.config_lines(v, section_name=k+indx,
                                                      section_comment=section_comment,
@@ -512,7 +509,7 @@ class ParSet(object):
             try:
                 if par.descr[k] is not None and include_descr:
                     lines += ParSet._config_comment(par.descr[k], component_indent)
-            except:
+            except (AttributeError, KeyError):
                 pass
             if not exclude_defaults or par[k] != par.default[k]:
                 lines += [ component_indent + k + ' = ' + ParSet._data_string(par[k]) ]
@@ -523,7 +520,7 @@ class ParSet(object):
             if include_descr:
                 try:
                     section_comment = par.descr[k]
-                except:
+                except (AttributeError, KeyError):
                     pass
             lines += ParSet.config_lines(par[k], section_name=k, section_comment=section_comment,
                                          section_level=section_level+1,
@@ -564,7 +561,7 @@ class ParSet(object):
         try:
             tr, tcols = numpy.array(os.popen('stty size', 'r').read().split()).astype(int)
             tcols -= int(tcols*0.1)
-        except:
+        except (OSError, ValueError):
             tr = None
             tcols = None
 
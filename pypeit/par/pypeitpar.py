@@ -3052,7 +3052,7 @@ class CalibrationsPar(ParSet):
                  pinholeframe=None, alignframe=None, alignment=None, traceframe=None,
                  illumflatframe=None,
                  standardframe=None, flatfield=None, wavelengths=None, slitedges=None, tilts=None,
-                 raise_chk_error=None):
+                 raise_chk_error=None, reuse_current_masters=None):
 
 
         # Grab the parameter names and values from the function
@@ -3087,6 +3087,13 @@ class CalibrationsPar(ParSet):
         dtypes['bpm_usebias'] = bool
         descr['bpm_usebias'] = 'Make a bad pixel mask from bias frames? Bias frames must be provided.'
 
+        defaults['reuse_current_masters'] = False
+        dtypes['reuse_current_masters'] = bool
+        descr['reuse_current_masters'] = 'Reuse the master frames that are newer than the raw ' \
+                                         'files used to build them and the master frames they ' \
+                                         'depend on, even if the masters are not otherwise ' \
+                                         'reused.  Changes to the parameters are not detected.'
+
         # Calibration Frames
         defaults['biasframe'] = FrameGroupPar(frametype='bias',
                                               process=ProcessImagesPar(apply_gain=False,
@@ -3190,7 +3197,8 @@ class CalibrationsPar(ParSet):
         k = numpy.array([*cfg.keys()])
 
         # Basic keywords
-        parkeys = [ 'master_dir', 'setup', 'bpm_usebias', 'raise_chk_error']
+        parkeys = [ 'master_dir', 'setup', 'bpm_usebias', 'raise_chk_error',
+                    'reuse_current_masters']
 
         allkeys = parkeys + ['biasframe', 'darkframe', 'arcframe', 'tiltframe', 'pixelflatframe',
                              'illumflatframe',
@@ -3427,17 +3435,16 @@ class PypeItPar(ParSet):
             parameter set.
         """
         # Get the base parameters in a ConfigObj instance
-        cfg = ConfigObj(PypeItPar().to_config() if cfg_file is None else cfg_file)
+        cfg = ConfigObj(PypeItPar().to_config(include_descr=False) if cfg_file is None
+                        else cfg_file)
 
         # Get the list of other configuration parameters to merge it with
         _merge_with = [] if merge_with is None else \
                         ([merge_with] if isinstance(merge_with, str) else merge_with)
-        merge_cfg = ConfigObj()
-        for f in _merge_with:
-            merge_cfg.merge(ConfigObj(f))
 
-        # Merge with the defaults
-        cfg.merge(merge_cfg)
+        # Merge each with the defaults, in order
+        for f in _merge_with:
+            cfg.merge(ConfigObj(f))
 
         # Evaluate the strings if requested
         if evaluate:
@@ -3503,7 +3510,8 @@ class PypeItPar(ParSet):
             parameter set.
         """
         # Get the base parameters in a ConfigObj instance
-        cfg = ConfigObj(PypeItPar().to_config() if cfg_lines is None else cfg_lines)
+        cfg = ConfigObj(PypeItPar().to_config(include_descr=False) if cfg_lines is None
+                        else cfg_lines)
 
         # Merge in additional parameters
         if merge_with is not None:
@@ -3580,34 +3588,32 @@ class PypeItPar(ParSet):
         pk = 'reduce'
         kwargs[pk] = ReducePar.from_dict(cfg[pk]) if pk in k else None
 
+        # The default parameter sets below are only instantiated if
+        # the relevant section is not in the configuration
+
         # Allow flexure to be turned on using cfg['rdx']
         pk = 'flexure'
-        default = FlexurePar()
-        kwargs[pk] = FlexurePar.from_dict(cfg[pk]) if pk in k else default
+        kwargs[pk] = FlexurePar.from_dict(cfg[pk]) if pk in k else FlexurePar()
 
         # Allow flux calibration to be turned on using cfg['rdx']
         pk = 'fluxcalib'
-        default = FluxCalibratePar() \
-                        if pk in cfg['rdx'].keys() and cfg['rdx']['fluxcalib'] else None
-        kwargs[pk] = FluxCalibratePar.from_dict(cfg[pk]) if pk in k else default
+        kwargs[pk] = FluxCalibratePar.from_dict(cfg[pk]) if pk in k \
+                        else (FluxCalibratePar() if pk in cfg['rdx'].keys() and cfg['rdx'][pk] else None)
 
         # Allow coadd1d  to be turned on using cfg['rdx']
         pk = 'coadd1d'
-        default = Coadd1DPar() \
-                        if pk in cfg['rdx'].keys() and cfg['rdx']['coadd1d'] else None
-        kwargs[pk] = Coadd1DPar.from_dict(cfg[pk]) if pk in k else default
+        kwargs[pk] = Coadd1DPar.from_dict(cfg[pk]) if pk in k \
+                        else (Coadd1DPar() if pk in cfg['rdx'].keys() and cfg['rdx'][pk] else None)
 
         # Allow coadd2d  to be turned on using cfg['rdx']
         pk = 'coadd2d'
-        default = Coadd2DPar() \
-                        if pk in cfg['rdx'].keys() and cfg['rdx']['coadd2d'] else None
-        kwargs[pk] = Coadd2DPar.from_dict(cfg[pk]) if pk in k else default
+        kwargs[pk] = Coadd2DPar.from_dict(cfg[pk]) if pk in k \
+                        else (Coadd2DPar() if pk in cfg['rdx'].keys() and cfg['rdx'][pk] else None)
 
         # Allow coadd2d  to be turned on using cfg['rdx']
         pk = 'sensfunc'
-        default = SensFuncPar() \
-                        if pk in cfg['rdx'].keys() and cfg['rdx']['sensfunc'] else None
-        kwargs[pk] = SensFuncPar.from_dict(cfg[pk]) if pk in k else default
+        kwargs[pk] = SensFuncPar.from_dict(cfg[pk]) if pk in k \
+                        else (SensFuncPar() if pk in cfg['rdx'].keys() and cfg['rdx'][pk] else None)
 
         if 'baseprocess' not in k:
             return cls(**kwargs)
@@ -3,7 +3,9 @@
 Utility functions for PypeIt parameter sets
 """
 import os
+import sys as _sys
 import time
+import builtins as _builtins
 import glob
 import warnings
 import textwrap
@@ -26,6 +28,62 @@ def _eval_ignore():
     return [ 'open', 'file', 'dict', 'list', 'tuple' ]
 
 
+# Strings with a known evaluation; these are returned directly by
+# _eval_value instead of being passed to eval
+_evaluated = {'None': None, 'True': True, 'False': False}
+
+
+def _eval_namespace():
+    """
+    Provides the names available when evaluating configuration values.
+
+    These are the public names of this module and the builtins; private
+    names (e.g., the ``_sys`` and ``_builtins`` modules) cannot be
+    evaluated.
+    """
+    namespace = dict([(k, v) for k, v in globals().items() if not k.startswith('_')])
+    namespace['__builtins__'] = _builtins
+    return namespace
+
+
+def _eval_value(v, ignore, namespace):
+    """
+    Evaluate a single configuration value.
+
+    Args:
+        v (object):
+            Value to evaluate; typically a string read from a
+            configuration file.
+        ignore (list):
+            Strings that should not be evaluated.
+        namespace (dict):
+            Global names available to the evaluation; see
+            :func:`_eval_namespace`.
+
+    Returns:
+        object: The result of `eval(v)`, or `v` itself if it is in
+        `ignore` or cannot be evaluated.
+    """
+    if v in ignore:
+        return v
+    if not isinstance(v, str):
+        try:
+            return eval(v, namespace)
+        except Exception:
+            return v
+    if v in _evaluated:
+        return _evaluated[v]
+    if v.isidentifier() and (v.startswith('_') or v not in namespace
+                             and not hasattr(_builtins, v)):
+        # Undefined and private names (e.g., 'median') are returned as
+        # is, without raising and catching a NameError
+        return v
+    try:
+        return eval(v, namespace)
+    except Exception:
+        return v
+
+
 def recursive_dict_evaluate(d):
     """
     Recursively run :func:`eval` on each element of the provided
@@ -45,7 +103,8 @@ def recursive_dict_evaluate(d):
 
         eval(d[k]) for k in d.keys()
 
-    raises an exception is returned as the original string.
+    raises an exception is returned as the original string.  The
+    evaluation of each value is done by :func:`_eval_value`.
 
     This is currently only used in :func:`PypitPar.from_cfg_file`; see
     further comments there.
@@ -60,25 +119,14 @@ def recursive_dict_evaluate(d):
         `d.keys()`.
     """
     ignore = _eval_ignore()
-    for k in d.keys():
-        if isinstance(d[k], dict):
-           d[k] = recursive_dict_evaluate(d[k])
-        elif isinstance(d[k], list):
-            replacement = []
-            for v in d[k]:
-                if v in ignore:
-                    replacement += [ v ]
-                else:
-                    try:
-                        replacement += [ eval(v) ]
-                    except:
-                        replacement += [ v ]
-            d[k] = replacement
+    namespace = _eval_namespace()
+    for k, dk in d.items():
+        if isinstance(dk, dict):
+            d[k] = recursive_dict_evaluate(dk)
+        elif isinstance(dk, list):
+            d[k] = [ _eval_value(v, ignore, namespace) for v in dk ]
         else:
-            try:
-                d[k] = eval(d[k]) if d[k] not in ignore else d[k]
-            except:
-                pass
+            d[k] = _eval_value(dk, ignore, namespace)
 
     return d
 
@@ -139,11 +187,12 @@ def get_parset_list(cfg, pk, parsetclass):
             try:
                 # Get the order for this subgroup (e.g., 2 for
                 # 'detector2'
-                order += [ int(_k.replace(pk,'')) ]
-                # And instantiate the parameter set
-                par += [ parsetclass.from_dict(cfg[_k]) ]
-            except:
+                _order = int(_k.replace(pk,''))
+            except ValueError:
                 continue
+            order += [ _order ]
+            # And instantiate the parameter set
+            par += [ parsetclass.from_dict(cfg[_k]) ]
 
     if len(par) > 0:
         # Make sure the instances are correctly sorted and sequential
@@ -170,7 +219,7 @@ def parset_to_dict(par):
     """
     try:
         d = dict(ConfigObj(par.to_config(section_name='tmp'))['tmp'])
-    except:
+    except KeyError:
         d = dict(ConfigObj(par.to_config()))
     return recursive_dict_evaluate(d)
 
@@ -179,6 +228,11 @@ def parset_to_dict(par):
 # Functions for parsing the input pypeit file
 # TODO: Should these go into a different module? PypitSetup?
 #-----------------------------------------------------------------------
+# Valid lines of the pypeit files already read, keyed by the full path
+# to the file; see _read_pypeit_file_lines
+_pypeit_file_lines = {}
+
+
 def _read_pypeit_file_lines(ifile):
     """
     General parser for a pypeit file.
@@ -189,6 +243,9 @@ def _read_pypeit_file_lines(ifile):
     
     Applies to settings, setup, and user-level reduction files.
 
+    The valid lines are kept in memory, such that the file is only
+    read again if its modification time or size has changed.
+
     Args:
         ifile (str): Name of the file to parse.
 
@@ -200,14 +257,23 @@ def _read_pypeit_file_lines(ifile):
     if not os.path.isfile(ifile):
         msgs.error('The filename does not exist -' + msgs.newline() + ifile)
 
+    # Use the previous read if the file has not changed
+    path = os.path.abspath(ifile)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if path in _pypeit_file_lines and _pypeit_file_lines[path][0] == stamp:
+        return _pypeit_file_lines[path][1].copy()
+
     # Read the input lines and replace special characters
     with open(ifile, 'r') as f:
         lines = np.array([l.replace('\t', ' ').replace('\n', ' ').strip() \
                                 for l in f.readlines()])
     # Remove empty or fully commented lines
     lines = lines[np.array([ len(l) > 0 and l[0] != '#' for l in lines ])]
-    # Remove appended comments and return
-    return np.array([ l.split('#')[0] for l in lines ])
+    # Remove appended comments
+    lines = np.array([ l.split('#')[0] for l in lines ])
+    _pypeit_file_lines[path] = (stamp, lines)
+    return lines.copy()
 
 
 def _find_pypeit_block(lines, group):
@@ -392,7 +458,9 @@ def _read_data_file_table(lines, file_check=True):
     tbl = np.empty((nfiles, len(header)), dtype=object)
 
     for i in range(nfiles):
-        row = np.array([ l.strip() for l in lines[i+npaths+1].split('|') ])[1:-1]
+        # Intern the entries; values like the frame types and setup
+        # names are repeated in many rows
+        row = [ _sys.intern(l.strip()) for l in lines[i+npaths+1].split('|')[1:-1] ]
         if len(row) != tbl.shape[1]:
             raise ValueError('Data and header lines have mismatched columns!')
         tbl[i,:] = row
@@ -572,37 +640,28 @@ def make_pypeit_file(pypeit_file, spectrograph, data_files, cfg_lines=None, setu
     # TODO: Clean up and check validity of _cfg_lines by reading it into
     # a ConfigObj?
 
-    # Here we go
+    # Here we go; build the file contents and write them at once
+    out = ['# Auto-generated PypeIt file\n',
+           '# {0}\n'.format(time.strftime("%a %d %b %Y %H:%M:%S",time.localtime())),
+           '\n',
+           '# User-defined execution parameters\n',
+           '\n'.join(_cfg_lines), '\n', '\n']
+    if setup_lines is not None:
+        out += ['# Setup\n', 'setup read\n']
+        out += [' '+sline+'\n' for sline in setup_lines]
+        out += ['setup end\n', '\n']
+    # Data
+    out += ['# Read in the data\n', 'data read\n']
+    # Old school
+    out += [' '+datafile+'\n' for datafile in data_files]
+    # paths and Setupfiles
+    if paths is not None:
+        out += [' path '+path+'\n' for path in paths]
+    if sorted_files is not None:
+        out += ['\n'.join(sorted_files), '\n']
+    out += ['data end\n', '\n']
     with open(pypeit_file, 'w') as f:
-        f.write('# Auto-generated PypeIt file\n')
-        f.write('# {0}\n'.format(time.strftime("%a %d %b %Y %H:%M:%S",time.localtime())))
-        f.write("\n")
-        f.write("# User-defined execution parameters\n")
-        f.write('\n'.join(_cfg_lines))
-        f.write('\n')
-        f.write('\n')
-        if setup_lines is not None:
-            f.write("# Setup\n")
-            f.write("setup read\n")
-            for sline in setup_lines:
-                f.write(' '+sline+'\n')
-            f.write("setup end\n")
-            f.write("\n")
-        # Data
-        f.write("# Read in the data\n")
-        f.write("data read\n")
-        # Old school
-        for datafile in data_files:
-            f.write(' '+datafile+'\n')
-        # paths and Setupfiles
-        if paths is not None:
-            for path in paths:
-                f.write(' path '+path+'\n')
-        if sorted_files is not None:
-            f.write('\n'.join(sorted_files))
-            f.write('\n')
-        f.write("data end\n")
-        f.write("\n")
+        f.write(''.join(out))
 
     msgs.info('PypeIt file written to: {0}'.format(pypeit_file))
 
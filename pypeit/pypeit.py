@@ -101,7 +101,8 @@ class PypeIt(object):
         if config_specific_file is not None:
             msgs.info(
                 'Setting configuration-specific parameters using {0}'.format(os.path.split(config_specific_file)[1]))
-        spectrograph_cfg_lines = self.spectrograph.config_specific_par(config_specific_file).to_config()
+        spectrograph_cfg_lines = self.spectrograph.config_specific_par(config_specific_file).to_config(
+                                    include_descr=False)
 
         #   - Build the full set, merging with any user-provided
         #     parameters
@@ -746,6 +747,7 @@ class PypeIt(object):
         # Reset the global logger
         msgs.reset(log=self.logname, verbosity=self.verbosity)
         msgs.pypeit_file = self.pypeit_file
+        msgs.qa_path = self.qa_path
 
     def print_end_time(self):
         """
@@ -136,7 +136,8 @@ class PypeItSetup(object):
 
         # Get the spectrograph specific configuration to be merged with
         # the user modifications.
-        spectrograph_cfg_lines = self.spectrograph.default_pypeit_par().to_config()
+        spectrograph_cfg_lines = self.spectrograph.default_pypeit_par().to_config(
+                                    include_descr=False)
 
         # Instantiate the pypeit parameters.  The user input
         # configuration (cfg_lines) can be None.
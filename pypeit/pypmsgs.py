@@ -6,9 +6,7 @@ Module for terminal and file logging.
 
 """
 import sys
-import os
 import getpass
-import glob
 import textwrap
 import inspect
 
@@ -67,6 +65,7 @@ class Messages:
         # object itself...
         self.sciexp = None
         self.pypeit_file = None
+        self.qa_path = None
 
         # Initialize the log
         self._log = None
@@ -102,9 +101,20 @@ class Messages:
 
     def _devmsg(self):
         if self._verbosity == 2:
-            info = inspect.getouterframes(inspect.currentframe())[3]
-            devmsg = self._start + self._blue_CL + info[1].split('/')[-1] + ' ' + str(info[2]) \
-                        + ' ' + info[3] + '()' + self._end + ' - '
+            # Step back to the frame that called the message method
+            # (_devmsg <- _print <- info, warn, etc. <- caller).  This
+            # avoids inspect.getouterframes, which builds the full stack
+            # and reads the source context of every frame.
+            frame = inspect.currentframe()
+            for i in range(3):
+                if frame is None:
+                    return ''
+                frame = frame.f_back
+            if frame is None:
+                return ''
+            devmsg = self._start + self._blue_CL + frame.f_code.co_filename.split('/')[-1] \
+                        + ' ' + str(frame.f_lineno) + ' ' + frame.f_code.co_name + '()' \
+                        + self._end + ' - '
         else:
             devmsg = ''
         return devmsg
@@ -190,28 +200,12 @@ class Messages:
         """
         Print pypeit usage data.
         """
-        # TODO: This is outdated
-        #stgs_arm = glob.glob(os.path.dirname(__file__)+'/data/settings/settings.arm*')
-        #stgs_all = glob.glob(os.path.dirname(__file__)+'/data/settings/settings.*')
-        #stgs_spc = list(set(stgs_arm) ^ set(stgs_all))
-        spectrographs = defs.pypeit_spectrographs
-
-        #armlist = os.path.basename(stgs_arm[0]).split('.')[-1]
-        #for i in range(1, len(stgs_arm)):
-        #    armlist += ', ' + os.path.basename(stgs_arm[i]).split('.')[-1]
-        #spclist = os.path.basename(stgs_spc[0]).split('.')[-1]
-        #for kk,istsp in enumerate(stgs_spc):
-        #    if (kk == 0) or ('base' in istsp) or ('py' in istsp.split('.')[-1]):
-        #        continue
-        #    spclist += ', ' + istsp.split('.')[-1]
-
-        spclist = ', '.join(spectrographs)
+        # The served spectrographs are listed in defs; no need to
+        # search the package directories for settings files
+        spclist = ', '.join(defs.pypeit_spectrographs)
         spcl = textwrap.wrap(spclist, width=60)
         descs = self.pypeitheader(prognm)
 
-        #descs += '\n##  Available pipelines include (OUTDATED):'
-        #descs += '\n##   ' + armlist
-
         descs += '\n##  Available spectrographs include:'
         for ispcl in spcl:
             descs += '\n##   ' + ispcl
@@ -224,7 +218,9 @@ class Messages:
         '''
         Close the log file before the code exits
         '''
-        close_qa(self.pypeit_file)
+        # Only build the QA HTML of a run that set its QA path
+        if self.qa_path is not None:
+            close_qa(self.pypeit_file, self.qa_path)
 #        from pypeit import arqa
 #        # QA HTML
 #        if self.pypeit_file is not None:  # Likely testing
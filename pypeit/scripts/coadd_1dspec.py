@@ -211,7 +211,8 @@ def main(args):
 
     # Parameters
     spectrograph_def_par = spectrograph.default_pypeit_par()
-    par = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_def_par.to_config(), merge_with=config_lines)
+    par = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_def_par.to_config(include_descr=False),
+                                             merge_with=config_lines)
     # Write the par to disk
     print("Writing the parameters to {}".format(args.par_outfile))
     par.to_config(args.par_outfile)
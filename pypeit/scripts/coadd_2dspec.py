@@ -120,7 +120,7 @@ def main(args):
         # just passing the pypeit file?
         # JFH: The reason is that the coadd2dfile may want different reduction parameters
         spectrograph_def_par = spectrograph.default_pypeit_par()
-        parset = par.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_def_par.to_config(),
+        parset = par.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_def_par.to_config(include_descr=False),
                                                  merge_with=config_lines)
     elif args.obj is not None:
         # TODO: We should probably be reading the pypeit file and using those parameters here rather than using the
@@ -135,8 +135,10 @@ def main(args):
         msgs.error('You must either input a coadd2d file with --file or an object name with --obj')
 
     # Update with configuration specific parameters (which requires science file) and initialize spectrograph
-    spectrograph_cfg_lines = spectrograph.config_specific_par(spec2d_files[0]).to_config()
-    parset = par.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_cfg_lines, merge_with=parset.to_config())
+    spectrograph_cfg_lines = spectrograph.config_specific_par(spec2d_files[0]).to_config(
+                                    include_descr=False)
+    parset = par.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_cfg_lines,
+                                          merge_with=parset.to_config(include_descr=False))
 
     # If detector was passed as an argument override whatever was in the coadd2d_file
     if args.det is not None:
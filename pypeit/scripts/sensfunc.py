@@ -137,7 +137,7 @@ def main(args):
     # If the .sens file was passed in read it and overwrite default parameters
     if args.sens_file is not None:
         cfg_lines = read_sensfile(args.sens_file)
-        par = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_def_par.to_config(),
+        par = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=spectrograph_def_par.to_config(include_descr=False),
                                                  merge_with=cfg_lines)
     else:
         par = spectrograph_def_par
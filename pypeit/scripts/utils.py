@@ -125,7 +125,8 @@ class Utilities:
         spectrograph_name = cfg['rdx']['spectrograph']
         self.spectrograph = load_spectrograph(spectrograph_name)
         msgs.info('Loaded spectrograph {0}'.format(self.spectrograph.spectrograph))
-        spectrograph_cfg_lines = self.spectrograph.config_specific_par(fname).to_config()
+        spectrograph_cfg_lines = self.spectrograph.config_specific_par(fname).to_config(
+                                    include_descr=False)
         # Load the parset
         self.par = PypeItPar.from_cfg_lines(cfg_lines=spectrograph_cfg_lines, merge_with=self.cfg_lines)
         return
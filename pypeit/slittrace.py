@@ -33,17 +33,13 @@ class SlitTraceBitMask(BitMask):
         ])
         super(SlitTraceBitMask, self).__init__(list(mask.keys()), descr=list(mask.values()))
 
-    @property
-    def exclude_for_reducing(self):
-        # Ignore these flags when reducing or considering reduced slits
-        return ['SKIPFLATCALIB']
+    # Ignore these flags when reducing or considering reduced slits
+    exclude_for_reducing = ('SKIPFLATCALIB',)
 
-    @property
-    def exclude_for_flexure(self):
-        # Ignore these flags when performing a flexure calculation
-        #  Currently they are *all* of the flags..
-        return ['SHORTSLIT', 'USERIGNORE', 'BADWVCALIB', 'BADTILTCALIB',
-                'SKIPFLATCALIB', 'BADFLATCALIB', 'BADREDUCE']
+    # Ignore these flags when performing a flexure calculation
+    #  Currently they are *all* of the flags..
+    exclude_for_flexure = ('SHORTSLIT', 'USERIGNORE', 'BADWVCALIB', 'BADTILTCALIB',
+                           'SKIPFLATCALIB', 'BADFLATCALIB', 'BADREDUCE')
 
 
 
@@ -602,7 +598,19 @@ class SlitTraceSet(datamodel.DataContainer):
             #TODO -- Consider putting in a tolerance which if not met causes a crash
             idx = np.argmin(np.abs(self.spat_id - slit_spat))
             msk[idx] = False
-        self.mask[msk] = self.bitmask.turn_on(self.mask[msk], 'USERIGNORE')
+        self._turn_on(msk, 'USERIGNORE')
+
+    def _turn_on(self, indx, flag):
+        """
+        Turn on a flag in :attr:`mask` for the selected slits, in place.
+
+        Args:
+            indx (`numpy.ndarray`_):
+                Boolean array selecting the slits to flag.
+            flag (:obj:`str`):
+                Bit name to turn on.
+        """
+        np.bitwise_or(self.mask, self.bitmask.turn_on(0, flag), out=self.mask, where=indx)
 
     def mask_flats(self, flatImages):
         """
@@ -616,7 +624,7 @@ class SlitTraceSet(datamodel.DataContainer):
         for flag in ['SKIPFLATCALIB', 'BADFLATCALIB']:
             bad_flats = self.bitmask.flagged(flatImages.bpmflats, flag)
             if np.any(bad_flats):
-                self.mask[bad_flats] = self.bitmask.turn_on(self.mask[bad_flats], flag)
+                self._turn_on(bad_flats, flag)
 
     def mask_wvcalib(self, wv_calib):
         """
@@ -629,9 +637,10 @@ class SlitTraceSet(datamodel.DataContainer):
         #for kk, spat_id in enumerate(self.spat_id):
         #    if wv_calib[str(spat_id)] is None:
         #        self.mask[kk] = self.bitmask.turn_on(self.mask[kk], 'BADWVCALIB')
-        for islit in range(self.nslits):
-            if wv_calib[str(self.slitord_id[islit])] is None or len(wv_calib[str(self.slitord_id[islit])]) == 0:
-                    self.mask[islit] = self.bitmask.turn_on(self.mask[islit], 'BADWVCALIB')
+        bad_wv = np.array([wv_calib[str(slitord)] is None or len(wv_calib[str(slitord)]) == 0
+                           for slitord in self.slitord_id], dtype=bool)
+        if np.any(bad_wv):
+            self._turn_on(bad_wv, 'BADWVCALIB')
 
     def mask_wavetilts(self, waveTilts):
         """
@@ -644,7 +653,7 @@ class SlitTraceSet(datamodel.DataContainer):
         # There is only one BPM for Tilts (so far)
         bad_tilts = waveTilts.bpmtilts > 0
         if np.any(bad_tilts):
-            self.mask[bad_tilts] = self.bitmask.turn_on(self.mask[bad_tilts], 'BADTILTCALIB')
+            self._turn_on(bad_tilts, 'BADTILTCALIB')
 
 def parse_slitspatnum(slitspatnum):
     """
@@ -386,9 +386,9 @@ class Spectrograph(object):
         """
         msgs.info("Generating a BPM for det={0:d} on {1:s}".format(det, self.camera))
         medval = np.median(msbias.image)
-        madval = 1.4826 * np.median(np.abs(medval - msbias.image))
-        ww = np.where(np.abs(msbias.image - medval) > 10.0 * madval)
-        bpm_img[ww] = 1
+        absdev = np.abs(msbias.image - medval)
+        madval = 1.4826 * np.median(absdev)
+        bpm_img[absdev > 10.0 * madval] = 1
 
         # Return
         return bpm_img
@@ -9,6 +9,47 @@ from IPython import embed
 # TODO: Allow the spectrographs to be identified by their camera?  Won't
 # work for 'shane_kast_red' and 'shane_kast_red_ret'.
 
+# The spectrograph classes, keyed by the name used to select them
+_spectrograph_classes = {
+    'gemini_gnirs': spectrographs.gemini_gnirs.GeminiGNIRSSpectrograph,
+    'gemini_flamingos1': spectrographs.gemini_flamingos.GeminiFLAMINGOS1Spectrograph,
+    'gemini_flamingos2': spectrographs.gemini_flamingos.GeminiFLAMINGOS2Spectrograph,
+    'keck_deimos': spectrographs.keck_deimos.KeckDEIMOSSpectrograph,
+    'keck_lris_blue': spectrographs.keck_lris.KeckLRISBSpectrograph,
+    'keck_kcwi': spectrographs.keck_kcwi.KeckKCWISpectrograph,
+    'keck_lris_red': spectrographs.keck_lris.KeckLRISRSpectrograph,
+    'keck_hires_red': spectrographs.keck_hires.KECKHIRESRSpectrograph,
+#    'keck_hires_blue': spectrographs.keck_hires.KECKHIRESBSpectrograph,
+    'keck_nires': spectrographs.keck_nires.KeckNIRESSpectrograph,
+    'keck_nirspec_low': spectrographs.keck_nirspec.KeckNIRSPECLowSpectrograph,
+    'keck_mosfire': spectrographs.keck_mosfire.KeckMOSFIRESpectrograph,
+    'magellan_fire': spectrographs.magellan_fire.MagellanFIREEchelleSpectrograph,
+    'magellan_fire_long': spectrographs.magellan_fire.MagellanFIRELONGSpectrograph,
+    'magellan_mage': spectrographs.magellan_mage.MagellanMAGESpectrograph,
+    'shane_kast_blue': spectrographs.shane_kast.ShaneKastBlueSpectrograph,
+    'shane_kast_red': spectrographs.shane_kast.ShaneKastRedSpectrograph,
+    'shane_kast_red_ret': spectrographs.shane_kast.ShaneKastRedRetSpectrograph,
+    'wht_isis_blue': spectrographs.wht_isis.WHTISISBlueSpectrograph,
+    'wht_isis_red': spectrographs.wht_isis.WHTISISRedSpectrograph,
+    'tng_dolores': spectrographs.tng_dolores.TNGDoloresSpectrograph,
+    'vlt_xshooter_uvb': spectrographs.vlt_xshooter.VLTXShooterUVBSpectrograph,
+    'vlt_xshooter_vis': spectrographs.vlt_xshooter.VLTXShooterVISSpectrograph,
+    'vlt_xshooter_nir': spectrographs.vlt_xshooter.VLTXShooterNIRSpectrograph,
+    'vlt_fors2': spectrographs.vlt_fors.VLTFORS2Spectrograph,
+    'gemini_gmos_south_ham': spectrographs.gemini_gmos.GeminiGMOSSHamSpectrograph,
+    'gemini_gmos_north_e2v': spectrographs.gemini_gmos.GeminiGMOSNE2VSpectrograph,
+    'gemini_gmos_north_ham': spectrographs.gemini_gmos.GeminiGMOSNHamSpectrograph,
+    'lbt_mods1r': spectrographs.lbt_mods.LBTMODS1RSpectrograph,
+    'lbt_mods2r': spectrographs.lbt_mods.LBTMODS2RSpectrograph,
+    'lbt_mods1b': spectrographs.lbt_mods.LBTMODS1BSpectrograph,
+    'lbt_mods2b': spectrographs.lbt_mods.LBTMODS2BSpectrograph,
+    'lbt_luci1': spectrographs.lbt_luci.LBTLUCI1Spectrograph,
+    'lbt_luci2': spectrographs.lbt_luci.LBTLUCI2Spectrograph,
+    'mmt_binospec': spectrographs.mmt_binospec.MMTBINOSPECSpectrograph,
+    'mdm_osmos_mdm4k': spectrographs.mdm_osmos.MDMOSMOSMDM4KSpectrograph,
+    'not_alfosc': spectrographs.not_alfosc.NOTALFOSCSpectrograph,
+}
+
 
 def load_spectrograph(spectrograph):
     """
@@ -33,116 +74,7 @@ def load_spectrograph(spectrograph):
     if isinstance(spectrograph, spectrographs.spectrograph.Spectrograph):
         return spectrograph
 
-    if spectrograph == 'gemini_gnirs':
-        return spectrographs.gemini_gnirs.GeminiGNIRSSpectrograph()
-
-    if spectrograph == 'gemini_flamingos1':
-        return spectrographs.gemini_flamingos.GeminiFLAMINGOS1Spectrograph()
-
-    if spectrograph == 'gemini_flamingos2':
-        return spectrographs.gemini_flamingos.GeminiFLAMINGOS2Spectrograph()
-
-    if spectrograph == 'keck_deimos':
-        return spectrographs.keck_deimos.KeckDEIMOSSpectrograph()
-
-    if spectrograph == 'keck_lris_blue':
-        return spectrographs.keck_lris.KeckLRISBSpectrograph()
-
-    if spectrograph == 'keck_kcwi':
-        return spectrographs.keck_kcwi.KeckKCWISpectrograph()
-
-    if spectrograph == 'keck_lris_red':
-        return spectrographs.keck_lris.KeckLRISRSpectrograph()
-
-    if spectrograph == 'keck_hires_red':
-        return spectrographs.keck_hires.KECKHIRESRSpectrograph()
-
-#    if spectrograph == 'keck_hires_blue':
-#        return spectrographs.keck_hires.KECKHIRESBSpectrograph()
-
-    if spectrograph == 'keck_nires':
-        return spectrographs.keck_nires.KeckNIRESSpectrograph()
-
-    if spectrograph == 'keck_nirspec_low':
-        return spectrographs.keck_nirspec.KeckNIRSPECLowSpectrograph()
-
-    if spectrograph == 'keck_mosfire':
-        return spectrographs.keck_mosfire.KeckMOSFIRESpectrograph()
-
-    if spectrograph == 'magellan_fire':
-        return spectrographs.magellan_fire.MagellanFIREEchelleSpectrograph()
-
-    if spectrograph == 'magellan_fire_long':
-        return spectrographs.magellan_fire.MagellanFIRELONGSpectrograph()
-
-    if spectrograph == 'magellan_mage':
-        return spectrographs.magellan_mage.MagellanMAGESpectrograph()
-
-    if spectrograph == 'shane_kast_blue':
-        return spectrographs.shane_kast.ShaneKastBlueSpectrograph()
-
-    if spectrograph == 'shane_kast_red':
-        return spectrographs.shane_kast.ShaneKastRedSpectrograph()
-
-    if spectrograph == 'shane_kast_red_ret':
-        return spectrographs.shane_kast.ShaneKastRedRetSpectrograph()
-
-    if spectrograph == 'wht_isis_blue':
-        return spectrographs.wht_isis.WHTISISBlueSpectrograph()
-
-    if spectrograph == 'wht_isis_red':
-        return spectrographs.wht_isis.WHTISISRedSpectrograph()
-
-    if spectrograph == 'tng_dolores':
-        return spectrographs.tng_dolores.TNGDoloresSpectrograph()
-
-    if spectrograph == 'vlt_xshooter_uvb':
-        return spectrographs.vlt_xshooter.VLTXShooterUVBSpectrograph()
-
-    if spectrograph == 'vlt_xshooter_vis':
-        return spectrographs.vlt_xshooter.VLTXShooterVISSpectrograph()
-
-    if spectrograph == 'vlt_xshooter_nir':
-        return spectrographs.vlt_xshooter.VLTXShooterNIRSpectrograph()
-
-    if spectrograph == 'vlt_fors2':
-        return spectrographs.vlt_fors.VLTFORS2Spectrograph()
-
-    if spectrograph == 'gemini_gmos_south_ham':
-        return spectrographs.gemini_gmos.GeminiGMOSSHamSpectrograph()
-
-    if spectrograph == 'gemini_gmos_north_e2v':
-        return spectrographs.gemini_gmos.GeminiGMOSNE2VSpectrograph()
-
-    if spectrograph == 'gemini_gmos_north_ham':
-        return spectrographs.gemini_gmos.GeminiGMOSNHamSpectrograph()
-
-    if spectrograph == 'lbt_mods1r':
-        return spectrographs.lbt_mods.LBTMODS1RSpectrograph()
-
-    if spectrograph == 'lbt_mods2r':
-        return spectrographs.lbt_mods.LBTMODS2RSpectrograph()
-
-    if spectrograph == 'lbt_mods1b':
-        return spectrographs.lbt_mods.LBTMODS1BSpectrograph()
-
-    if spectrograph == 'lbt_mods2b':
-        return spectrographs.lbt_mods.LBTMODS2BSpectrograph()
-
-    if spectrograph == 'lbt_luci1':
-        return spectrographs.lbt_luci.LBTLUCI1Spectrograph()
-
-    if spectrograph == 'lbt_luci2':
-        return spectrographs.lbt_luci.LBTLUCI2Spectrograph()
-
-    if spectrograph == 'mmt_binospec':
-        return spectrographs.mmt_binospec.MMTBINOSPECSpectrograph()
-
-    if spectrograph == 'mdm_osmos_mdm4k':
-        return spectrographs.mdm_osmos.MDMOSMOSMDM4KSpectrograph()
-
-    if spectrograph == 'not_alfosc':
-        return spectrographs.not_alfosc.NOTALFOSCSpectrograph()
-
-    msgs.error('{0} is not a supported spectrograph.'.format(spectrograph))
+    if spectrograph not in _spectrograph_classes:
+        msgs.error('{0} is not a supported spectrograph.'.format(spectrograph))
+    return _spectrograph_classes[spectrograph]()
 
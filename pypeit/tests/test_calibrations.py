@@ -101,6 +101,66 @@ def test_arc(multi_caliBrate):
     assert arc.image.shape == (2048,350)
 
 
+def current_calib(calib, master_dir):
+    # Instantiate calibrations that reuse the masters in master_dir that
+    # are newer than their input.  A new parameter set is used so that
+    # the fixture is left unchanged.
+    par = pypeitpar.CalibrationsPar(reuse_current_masters=True)
+    return reset_calib(calibrations.MultiSlitCalibrations(calib.fitstbl, par,
+                                                          calib.spectrograph, master_dir))
+
+
+def write_file(path, mtime):
+    # Write a stand-in file with the provided modification time
+    with open(path, 'w') as f:
+        f.write(os.path.basename(path))
+    os.utime(path, (mtime, mtime))
+
+
+def test_reuse_current_masters(multi_caliBrate, tmp_path):
+    # Use a temporary directory so that the masters do not affect the
+    # other tests
+    master_dir = str(tmp_path / 'Masters')
+    caliBrate = current_calib(multi_caliBrate, master_dir)
+    # Stand-ins for the raw arc frames and the masters written by
+    # get_arc, get_wv_calib and get_tilts
+    arc_files = [str(tmp_path / 'arc{0}.fits'.format(i)) for i in range(2)]
+    for f in arc_files:
+        write_file(f, 1000)
+    masters = dict([(step, os.path.join(master_dir, 'Master{0}_A_1_01.fits'.format(step)))
+                        for step in ['arc', 'wv_calib', 'tilts']])
+    for step in ['arc', 'wv_calib', 'tilts']:
+        write_file(masters[step], 2000)
+
+    # Nothing has changed
+    for step in ['arc', 'wv_calib', 'tilts']:
+        assert caliBrate._reuse_master(masters[step], step,
+                                       arc_files if step == 'arc' else []), \
+                '{0} should be reused'.format(step)
+    # ... but the masters are not reused by default
+    assert not multi_caliBrate._reuse_master(masters['arc'], 'arc', arc_files), \
+            'Arc should be rebuilt if the current masters are not reused'
+
+    # Replace a raw frame; the arc, and the wavelength calibration and
+    # tilts built from it, must be rebuilt
+    write_file(arc_files[0], 3000)
+    caliBrate = current_calib(multi_caliBrate, master_dir)
+    assert not caliBrate._reuse_master(masters['arc'], 'arc', arc_files), \
+            'Arc built from the old raw frame should not be reused'
+    assert not caliBrate._reuse_master(masters['wv_calib'], 'wv_calib'), \
+            'WaveCalib built from the old arc should not be reused'
+    assert not caliBrate._reuse_master(masters['tilts'], 'tilts'), \
+            'Tilts built from the old wavelength calibration should not be reused'
+
+    # The same holds for a new run if the previous one was interrupted
+    # after rebuilding the arc
+    write_file(masters['arc'], 4000)
+    caliBrate = current_calib(multi_caliBrate, master_dir)
+    assert caliBrate._reuse_master(masters['arc'], 'arc', arc_files), 'Arc should be reused'
+    assert not caliBrate._reuse_master(masters['wv_calib'], 'wv_calib'), \
+            'WaveCalib built from the old arc should not be reused'
+
+
 def test_tiltimg(multi_caliBrate):
     tilt = multi_caliBrate.get_tiltimg()
     assert tilt.image.shape == (2048,350)
@@ -6,7 +6,7 @@ import os
 import pytest
 
 from pypeit.par import pypeitpar
-from pypeit.par.util import parse_pypeit_file
+from pypeit.par.util import parse_pypeit_file, recursive_dict_evaluate
 from pypeit.spectrographs.util import load_spectrograph
 
 def data_path(filename):
@@ -163,6 +163,15 @@ def test_pypeit_file():
     assert p['calibrations']['traceframe']['process']['combine'] == 'mean'
     assert p['scienceframe']['process']['n_lohi'] == [8, 8]
 
+def test_evaluate():
+    d = recursive_dict_evaluate({'a': '1.5', 'b': ['None', 'median'],
+                                 'c': {'d': 'sys', 'e': '_sys', 'f': '_builtins.open'}})
+    assert d['a'] == 1.5 and d['b'] == [None, 'median'], 'Bad evaluation'
+    # Module names, and the private names of pypeit.par.util, are kept
+    # as strings
+    assert d['c'] == {'d': 'sys', 'e': '_sys', 'f': '_builtins.open'}, \
+            'Private names should not be evaluated'
+
 def test_telescope():
     pypeitpar.TelescopePar()
 
@@ -25,3 +25,15 @@ def test_get_dimen():
     assert (len(pages) == 4) and (pages[0][0] * pages[0][1] == maxp+1) and (pages[1][0] * pages[1][1] == maxp+1) \
         and (pages[2][0] * pages[2][1] == maxp + 1) and (pages[3][0] * pages[3][1] == 1)
     assert (len(npp) == 4) and (npp[0] == maxp) and (npp[1] == maxp) and (npp[2] == maxp) and (npp[3] == 1)
+
+
+def test_close_qa(tmp_path, monkeypatch):
+    # Run from an empty directory, so that there are no exposure QA PNGs
+    monkeypatch.chdir(tmp_path)
+    pypeit_file = str(tmp_path / 'test.pypeit')
+    # An empty calib file, as left by an early crash, must not raise
+    open(str(tmp_path / 'test.calib'), 'w').close()
+    qa.close_qa(pypeit_file, str(tmp_path))
+    # Nothing to do without a QA path
+    qa.close_qa(pypeit_file, None)
+    assert len(list(tmp_path.glob('*.html'))) == 0
@@ -1996,7 +1996,7 @@ def save_pickle(fname, obj):
     obj : :class:`object`
         An object suitable for pickle serialization.
     """
-    if fname.split(".")[-1] != 'pkl':
+    if not fname.endswith('.pkl'):
         fname += '.pkl'
     with open(fname, 'wb') as f:
         pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)